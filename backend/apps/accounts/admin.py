@@ -1,6 +1,8 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 
+from apps.core.pagination import FasterAdminPaginator
+
 from .models import Membership, Organization, RegionAssignment, StoreAssignment, SupportTicket, TicketMessage, User
 
 
@@ -28,16 +30,19 @@ class OrganizationAdmin(admin.ModelAdmin):
     list_display = ('name', 'slug', 'owner', 'created_at')
     search_fields = ('name', 'slug')
     prepopulated_fields = {'slug': ('name',)}
+    autocomplete_fields = ('owner',)
 
 
 class RegionAssignmentInline(admin.TabularInline):
     model = RegionAssignment
     extra = 0
+    autocomplete_fields = ('region',)
 
 
 class StoreAssignmentInline(admin.TabularInline):
     model = StoreAssignment
     extra = 0
+    autocomplete_fields = ('store',)
 
 
 @admin.register(Membership)
@@ -45,23 +50,44 @@ class MembershipAdmin(admin.ModelAdmin):
     list_display = ('user', 'organization', 'role', 'created_at')
     list_filter = ('role',)
     search_fields = ('user__email', 'organization__name')
+    list_select_related = ('user', 'organization')
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    autocomplete_fields = ('user', 'organization')
     inlines = [RegionAssignmentInline, StoreAssignmentInline]
 
+    def get_queryset(self, request):
+        # Membership.__str__ reads user and organization; this also covers
+        # the autocomplete results used by the assignment admins.
+        return super().get_queryset(request).select_related('user', 'organization')
+
 
 @admin.register(RegionAssignment)
 class RegionAssignmentAdmin(admin.ModelAdmin):
     list_display = ('membership', 'region', 'created_at')
+    list_select_related = ('membership__user', 'membership__organization', 'region')
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    autocomplete_fields = ('membership', 'region')
 
 
 @admin.register(StoreAssignment)
 class StoreAssignmentAdmin(admin.ModelAdmin):
     list_display = ('membership', 'store', 'created_at')
+    list_select_related = ('membership__user', 'membership__organization', 'store')
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    autocomplete_fields = ('membership', 'store')
 
 
 class TicketMessageInline(admin.TabularInline):
     model = TicketMessage
     extra = 0
     readonly_fields = ('created_at',)
+    autocomplete_fields = ('user',)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user')
 
 
 @admin.register(SupportTicket)
@@ -69,4 +95,15 @@ class SupportTicketAdmin(admin.ModelAdmin):
     list_display = ('subject', 'status', 'priority', 'user', 'organization', 'created_at')
     list_filter = ('status', 'priority')
     search_fields = ('subject', 'user__email', 'organization__name')
+    list_select_related = ('user', 'organization')
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    autocomplete_fields = ('user', 'organization')
     inlines = [TicketMessageInline]
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        match = request.resolver_match
+        if match and match.url_name == 'accounts_supportticket_changelist':
+            return qs.for_list()
+        return qs
@@ -59,6 +59,11 @@ class Lead(TimestampedModel):
     class Meta:
         db_table = 'accounts_lead'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], name='lead_created_at_idx'),
+            # Serves the newest-lead-by-email lookups in the capture views
+            models.Index(fields=['email', '-created_at'], name='lead_email_created_idx'),
+        ]
 
     def __str__(self):
         return f'{self.first_name} {self.last_name} ({self.email})'
@@ -89,6 +94,14 @@ class DripEmail(models.Model):
         db_table = 'accounts_drip_email'
         ordering = ['scheduled_at']
         unique_together = [('lead', 'step')]
+        indexes = [
+            # Serves the hourly due-email scan (unsent rows ordered by schedule)
+            models.Index(
+                fields=['scheduled_at'],
+                name='dripemail_due_idx',
+                condition=models.Q(sent_at__isnull=True),
+            ),
+        ]
 
     def __str__(self):
         status = f'sent {self.sent_at}' if self.sent_at else f'scheduled {self.scheduled_at}'
@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
+from django.db import IntegrityError, transaction
 from decouple import config
 
 
@@ -11,13 +12,25 @@ class Command(BaseCommand):
         email = config('DJANGO_SUPERUSER_EMAIL', default='admin@storescore.app')
         password = config('DJANGO_SUPERUSER_PASSWORD', default='changeme123!')
 
-        if not User.objects.filter(email=email).exists():
-            User.objects.create_superuser(
-                email=email,
-                password=password,
-                first_name='Admin',
-                last_name='User',
-            )
+        # Single get-or-insert so concurrent container boots can't both create the user
+        try:
+            with transaction.atomic():
+                user, created = User.objects.get_or_create(
+                    email=User.objects.normalize_email(email),
+                    defaults={
+                        'first_name': 'Admin',
+                        'last_name': 'User',
+                        'is_staff': True,
+                        'is_superuser': True,
+                    },
+                )
+                if created:
+                    user.set_password(password)
+                    user.save(update_fields=['password'])
+        except IntegrityError:
+            created = False
+
+        if created:
             self.stdout.write(self.style.SUCCESS(f'Superuser {email} created'))
         else:
             self.stdout.write(self.style.WARNING(f'Superuser {email} already exists'))
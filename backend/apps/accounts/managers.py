@@ -1,4 +1,9 @@
+import re
+
 from django.contrib.auth.models import BaseUserManager
+from django.db import models
+from django.db.models import Prefetch
+from django.utils.text import slugify
 
 
 class CustomUserManager(BaseUserManager):
@@ -24,3 +29,84 @@ class CustomUserManager(BaseUserManager):
             raise ValueError('Superuser must have is_superuser=True.')
 
         return self.create_user(email, password, **extra_fields)
+
+    def get_by_natural_key(self, email):
+        # Match login emails regardless of case via the uniq_user_email_ci index
+        return self.get(email__iexact=email)
+
+
+class OrganizationManager(models.Manager):
+    """Manager for Organization."""
+
+    def unique_slug(self, name):
+        """
+        Return slugify(name) (or 'org' if that is empty), suffixed with the
+        lowest free ``-N`` if taken.
+        Candidate slugs are read in one query instead of one EXISTS query per
+        collision: the prefix match is served by the slug ``_like`` index and
+        the regex drops longer slugs that merely share the prefix.
+        """
+        base_slug = slugify(name) or 'org'
+        taken = set(
+            self.filter(
+                slug__startswith=base_slug,
+                slug__regex=rf'^{re.escape(base_slug)}(-[0-9]+)?$',
+            ).values_list('slug', flat=True)
+        )
+        slug = base_slug
+        counter = 1
+        while slug in taken:
+            slug = f'{base_slug}-{counter}'
+            counter += 1
+        return slug
+
+
+def assignment_prefetches():
+    """
+    Prefetches for the region/store assignments OrgMemberSerializer renders,
+    loading only the columns it reads. Pass to prefetch_related_objects()
+    when serializing a single membership.
+    """
+    from .models import RegionAssignment, StoreAssignment
+
+    return (
+        Prefetch(
+            'region_assignments',
+            queryset=RegionAssignment.objects.select_related('region').only(
+                'id', 'membership_id', 'region__id', 'region__name',
+            ),
+        ),
+        Prefetch(
+            'store_assignments',
+            queryset=StoreAssignment.objects.select_related('store').only(
+                'id', 'membership_id', 'store__id', 'store__name',
+            ),
+        ),
+    )
+
+
+class MembershipQuerySet(models.QuerySet):
+    """QuerySet for Membership with the relations member listings traverse."""
+
+    def with_related(self):
+        return self.select_related('user', 'organization').prefetch_related(*assignment_prefetches())
+
+
+class SupportTicketQuerySet(models.QuerySet):
+    """QuerySet for SupportTicket."""
+
+    def for_list(self):
+        """Skip the long text columns that ticket listings don't display."""
+        return self.defer('description', 'resolution_notes').select_related('organization', 'user')
+
+    def with_related(self):
+        """
+        Load what SupportTicketSerializer renders: the author and organization
+        joined, and the messages with their authors in a single extra query.
+        """
+        from .models import TicketMessage
+
+        return self.select_related('user', 'organization').prefetch_related(
+            Prefetch('messages', queryset=TicketMessage.objects.select_related('user')),
+        )
+
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.15 on 2026-10-17 05:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dripemail',
+            index=models.Index(condition=models.Q(('sent_at__isnull', True)), fields=['scheduled_at'], name='dripemail_due_idx'),
+        ),
+    ]
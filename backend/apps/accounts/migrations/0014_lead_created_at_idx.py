@@ -0,0 +1,17 @@
+# Generated by Django 5.1.15 on 2026-10-17 05:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0013_dripemail_due_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['-created_at'], name='lead_created_at_idx'),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.1.15 on 2026-10-17 05:57
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def check_sentry_duplicates(apps, schema_editor):
+    """
+    Refuse to build the index while a Sentry issue has more than one ticket:
+    CREATE UNIQUE INDEX CONCURRENTLY would fail part-way and leave an
+    INVALID index behind. Those tickets need merging by hand first.
+    """
+    SupportTicket = apps.get_model('accounts', 'SupportTicket')
+    duplicates = list(
+        SupportTicket.objects.filter(source='sentry')
+        .exclude(external_id='')
+        .values('external_id')
+        .annotate(n=Count('id'))
+        .filter(n__gt=1)
+        .values_list('external_id', flat=True)[:20]
+    )
+    if duplicates:
+        raise RuntimeError(
+            'Cannot add uniq_sentry_external_id: these Sentry issues have more '
+            f'than one support ticket: {", ".join(duplicates)}. '
+            'Merge or delete the duplicate tickets and re-run the migration.'
+        )
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0014_lead_created_at_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='supportticket',
+            index=models.Index(fields=['organization', '-created_at'], name='ticket_org_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='supportticket',
+            index=models.Index(fields=['status', '-created_at'], name='ticket_status_created_idx'),
+        ),
+        migrations.RunPython(check_sentry_duplicates, migrations.RunPython.noop),
+        # Build the index without blocking writes to accounts_supportticket
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='supportticket',
+                    constraint=models.UniqueConstraint(condition=models.Q(('source', 'sentry'), models.Q(('external_id', ''), _negated=True)), fields=('source', 'external_id'), name='uniq_sentry_external_id'),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    # Drop an INVALID index left by an earlier failed attempt
+                    # (the migration is unrecorded, so any existing one is that)
+                    sql=[
+                        'DROP INDEX CONCURRENTLY IF EXISTS "uniq_sentry_external_id";',
+                        'CREATE UNIQUE INDEX CONCURRENTLY "uniq_sentry_external_id" ON "accounts_supportticket" '
+                        """("source", "external_id") WHERE ("source" = 'sentry' AND NOT ("external_id" = ''));""",
+                    ],
+                    reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS "uniq_sentry_external_id";',
+                ),
+            ],
+        ),
+    ]
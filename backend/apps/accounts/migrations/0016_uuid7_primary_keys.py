@@ -0,0 +1,49 @@
+# Generated by Django 5.1.15 on 2026-10-17 05:58
+
+import apps.core.uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0015_supportticket_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='membership',
+            name='id',
+            field=models.UUIDField(default=apps.core.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='organization',
+            name='id',
+            field=models.UUIDField(default=apps.core.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='regionassignment',
+            name='id',
+            field=models.UUIDField(default=apps.core.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='storeassignment',
+            name='id',
+            field=models.UUIDField(default=apps.core.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='supportticket',
+            name='id',
+            field=models.UUIDField(default=apps.core.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='ticketmessage',
+            name='id',
+            field=models.UUIDField(default=apps.core.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='id',
+            field=models.UUIDField(default=apps.core.uuid.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.1.15 on 2026-10-17 05:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0016_uuid7_primary_keys'),
+        ('stores', '0015_orgsettings_location_enforcement'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='membership',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='regionassignment',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='storeassignment',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='membership',
+            constraint=models.UniqueConstraint(fields=('user', 'organization'), name='uniq_membership_user_org'),
+        ),
+        migrations.AddConstraint(
+            model_name='regionassignment',
+            constraint=models.UniqueConstraint(fields=('membership', 'region'), name='uniq_regionassignment'),
+        ),
+        migrations.AddConstraint(
+            model_name='storeassignment',
+            constraint=models.UniqueConstraint(fields=('membership', 'store'), name='uniq_storeassignment'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.1.15 on 2026-10-17 05:59
+
+import apps.core.storage
+from django.db import migrations, models
+
+from apps.core.migrations_utils import chunked_bulk_update
+
+
+def _set_image(apps, value_from, value_to):
+    for model_name, field in (('User', 'avatar'), ('Organization', 'logo')):
+        model = apps.get_model('accounts', model_name)
+        chunked_bulk_update(
+            model.objects.filter(**{field: value_from}),
+            lambda obj, field=field: setattr(obj, field, value_to),
+            fields=[field],
+        )
+
+
+def empty_images_to_null(apps, schema_editor):
+    _set_image(apps, '', None)
+
+
+def null_images_to_empty(apps, schema_editor):
+    _set_image(apps, None, '')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0018_user_full_name_generated'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='organization',
+            name='logo',
+            field=models.ImageField(blank=True, default=None, null=True, upload_to='apps.core.storage.org_file_path'),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='avatar',
+            field=models.ImageField(blank=True, default=None, null=True, upload_to=apps.core.storage.user_avatar_path),
+        ),
+        migrations.RunPython(empty_images_to_null, null_images_to_empty),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:00
+
+import logging
+import posixpath
+
+import apps.core.storage
+from django.core.files.storage import default_storage
+from django.db import migrations, models, transaction
+
+from apps.core.migrations_utils import chunked_bulk_update
+from apps.core.storage import org_logo_path
+
+logger = logging.getLogger(__name__)
+
+# Where logos landed while upload_to was the literal string
+MISFILED_PREFIX = 'apps.core.storage.org_file_path/'
+
+
+def _delete_originals(names):
+    for name in names:
+        try:
+            default_storage.delete(name)
+        except Exception as e:
+            logger.warning(f'Could not delete moved logo {name}: {e}')
+
+
+def move_misfiled_logos(apps, schema_editor):
+    """
+    Copy misfiled logos to their org path and repoint the rows. Originals
+    are only deleted once the migration's transaction commits, so a failure
+    part-way leaves every row pointing at a file that still exists.
+    """
+    Organization = apps.get_model('accounts', 'Organization')
+    moved = []
+
+    def move(org):
+        old_name = org.logo.name
+        try:
+            if not default_storage.exists(old_name):
+                return False
+            filename = posixpath.basename(old_name)
+            with default_storage.open(old_name) as f:
+                new_name = default_storage.save(org_logo_path(org, filename), f)
+        except Exception as e:
+            # Leave this row on its old path rather than abort the whole run
+            logger.warning(f'Could not copy logo {old_name} for org {org.pk}: {e}')
+            return False
+        moved.append(old_name)
+        org.logo.name = new_name
+
+    chunked_bulk_update(
+        Organization.objects.filter(logo__startswith=MISFILED_PREFIX),
+        move,
+        fields=['logo'],
+        read_fields=['slug'],
+        batch=500,
+    )
+    transaction.on_commit(lambda: _delete_originals(moved), using=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0019_image_fields_nullable'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='organization',
+            name='logo',
+            field=models.ImageField(blank=True, default=None, null=True, upload_to=apps.core.storage.org_logo_path),
+        ),
+        migrations.RunPython(move_misfiled_logos, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0020_organization_logo_upload_path'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='membership',
+            name='role_bits',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(role='owner', then=models.Value(1)), models.When(role='admin', then=models.Value(2)), models.When(role='regional_manager', then=models.Value(4)), models.When(role='store_manager', then=models.Value(8)), models.When(role='manager', then=models.Value(16)), models.When(role='finance', then=models.Value(32)), models.When(role='member', then=models.Value(64)), models.When(role='evaluator', then=models.Value(128)), default=models.Value(0)), output_field=models.PositiveSmallIntegerField()),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:03
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Upper
+
+
+def check_case_duplicates(apps, schema_editor):
+    """
+    Refuse to build the index while emails that differ only in case exist:
+    CREATE UNIQUE INDEX CONCURRENTLY would fail part-way and leave an
+    INVALID index behind. Those accounts need merging by hand first.
+    """
+    User = apps.get_model('accounts', 'User')
+    duplicates = list(
+        User.objects.annotate(email_upper=Upper('email'))
+        .values('email_upper')
+        .annotate(n=Count('id'))
+        .filter(n__gt=1)
+        .values_list('email_upper', flat=True)[:20]
+    )
+    if duplicates:
+        raise RuntimeError(
+            'Cannot add uniq_user_email_ci: these emails belong to more than one '
+            f'user when compared case-insensitively: {", ".join(duplicates)}. '
+            'Merge or rename the duplicate accounts and re-run the migration.'
+        )
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0021_membership_role_bits'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_case_duplicates, migrations.RunPython.noop),
+        # Build the index without blocking writes to accounts_user
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='user',
+                    constraint=models.UniqueConstraint(django.db.models.functions.text.Upper('email'), name='uniq_user_email_ci'),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    # Drop an INVALID index left by an earlier failed attempt
+                    # (the migration is unrecorded, so any existing one is that)
+                    sql=[
+                        'DROP INDEX CONCURRENTLY IF EXISTS "uniq_user_email_ci";',
+                        'CREATE UNIQUE INDEX CONCURRENTLY "uniq_user_email_ci" ON "accounts_user" (UPPER("email"));',
+                    ],
+                    reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS "uniq_user_email_ci";',
+                ),
+            ],
+        ),
+    ]
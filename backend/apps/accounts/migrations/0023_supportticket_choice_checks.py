@@ -0,0 +1,29 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0022_user_email_ci_unique'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='supportticket',
+            constraint=models.CheckConstraint(condition=models.Q(('status__in', ['open', 'in_progress', 'resolved', 'closed'])), name='ck_supportticket_status'),
+        ),
+        migrations.AddConstraint(
+            model_name='supportticket',
+            constraint=models.CheckConstraint(condition=models.Q(('priority__in', ['low', 'medium', 'high'])), name='ck_supportticket_priority'),
+        ),
+        migrations.AddConstraint(
+            model_name='supportticket',
+            constraint=models.CheckConstraint(condition=models.Q(('category__in', ['bug', 'ui_feedback', 'enhancement', 'question', 'other'])), name='ck_supportticket_category'),
+        ),
+        migrations.AddConstraint(
+            model_name='supportticket',
+            constraint=models.CheckConstraint(condition=models.Q(('source__in', ['manual', 'sentry'])), name='ck_supportticket_source'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:04
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0023_supportticket_choice_checks'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='ticketmessage',
+            index=models.Index(fields=['ticket', 'created_at'], include=('user',), name='idx_ticketmsg_ticket_created'),
+        ),
+    ]
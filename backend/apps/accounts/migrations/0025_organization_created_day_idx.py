@@ -0,0 +1,21 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:15
+
+import django.db.models.functions.datetime
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0024_ticketmessage_thread_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='organization',
+            index=models.Index(django.db.models.functions.datetime.TruncDate('created_at'), name='org_created_day_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.15 on 2026-10-17 06:20
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0025_organization_created_day_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='lead',
+            index=models.Index(fields=['email', '-created_at'], name='lead_email_created_idx'),
+        ),
+    ]
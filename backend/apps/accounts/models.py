@@ -1,12 +1,19 @@
-import uuid
-
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Concat, Trim, TruncDate, Upper
 
 from apps.core.models import TimestampedModel
-from apps.core.storage import user_avatar_path
+from apps.core.storage import org_logo_path, user_avatar_path
+from apps.core.uuid import uuid7
 
-from .managers import CustomUserManager
+from .managers import (
+    CustomUserManager,
+    MembershipQuerySet,
+    OrganizationManager,
+    SupportTicketQuerySet,
+)
 
 # Import Lead and DripEmail models so Django discovers them
 from .leads import DripEmail, Lead  # noqa: F401
@@ -14,14 +21,19 @@ from .leads import DripEmail, Lead  # noqa: F401
 
 class User(AbstractBaseUser, PermissionsMixin):
     """Custom user model with email-based authentication."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     email = models.EmailField(unique=True)
     first_name = models.CharField(max_length=150)
     last_name = models.CharField(max_length=150)
-    avatar = models.ImageField(upload_to=user_avatar_path, blank=True, default='')
+    avatar = models.ImageField(upload_to=user_avatar_path, blank=True, null=True, default=None)
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
     date_joined = models.DateTimeField(auto_now_add=True)
+    full_name = models.GeneratedField(
+        expression=Trim(Concat('first_name', Value(' '), 'last_name')),
+        output_field=models.CharField(max_length=301),
+        db_persist=True,
+    )
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['first_name', 'last_name']
@@ -30,13 +42,29 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     class Meta:
         db_table = 'accounts_user'
+        # Trigram indexes over UPPER(col) match what icontains compiles to on
+        # PostgreSQL, so admin search can use them instead of a seq scan.
+        indexes = [
+            GinIndex(OpClass(Upper('email'), name='gin_trgm_ops'), name='accounts_user_email_trgm'),
+            GinIndex(OpClass(Upper('first_name'), name='gin_trgm_ops'), name='accounts_user_fname_trgm'),
+            GinIndex(OpClass(Upper('last_name'), name='gin_trgm_ops'), name='accounts_user_lname_trgm'),
+        ]
+        constraints = [
+            # Case-insensitive uniqueness; also serves email__iexact lookups,
+            # which compile to UPPER(email) = UPPER(%s) on PostgreSQL.
+            models.UniqueConstraint(Upper('email'), name='uniq_user_email_ci'),
+        ]
 
     def __str__(self):
         return self.email
 
-    @property
-    def full_name(self):
-        return f'{self.first_name} {self.last_name}'.strip()
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if not adding:
+            # full_name is computed by the database; drop the stale value so
+            # the next access reloads it.
+            self.__dict__.pop('full_name', None)
 
 
 class Organization(TimestampedModel):
@@ -54,7 +82,7 @@ class Organization(TimestampedModel):
         HOSPITALITY = 'hospitality', 'Hospitality / Hotel'
         OTHER = 'other', 'Other'
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=255)
     slug = models.SlugField(unique=True, max_length=255)
     owner = models.ForeignKey(
@@ -63,9 +91,10 @@ class Organization(TimestampedModel):
         related_name='owned_organizations',
     )
     logo = models.ImageField(
-        upload_to='apps.core.storage.org_file_path',
+        upload_to=org_logo_path,
         blank=True,
-        default='',
+        null=True,
+        default=None,
     )
     industry = models.CharField(
         max_length=30,
@@ -83,13 +112,44 @@ class Organization(TimestampedModel):
         help_text='Inactive organizations are disabled and cannot be accessed.',
     )
 
+    objects = OrganizationManager()
+
     class Meta:
         db_table = 'accounts_organization'
+        indexes = [
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='accounts_org_name_trgm'),
+            # Serves the platform engagement view's signups-per-day grouping
+            models.Index(TruncDate('created_at'), name='org_created_day_idx'),
+        ]
 
     def __str__(self):
         return self.name
 
 
+class RoleBit:
+    """Bit flags for Membership.role, for integer permission checks."""
+    OWNER = 1 << 0
+    ADMIN = 1 << 1
+    REGIONAL_MANAGER = 1 << 2
+    STORE_MANAGER = 1 << 3
+    MANAGER = 1 << 4
+    FINANCE = 1 << 5
+    MEMBER = 1 << 6
+    EVALUATOR = 1 << 7
+
+
+ROLE_BITS = {
+    'owner': RoleBit.OWNER,
+    'admin': RoleBit.ADMIN,
+    'regional_manager': RoleBit.REGIONAL_MANAGER,
+    'store_manager': RoleBit.STORE_MANAGER,
+    'manager': RoleBit.MANAGER,
+    'finance': RoleBit.FINANCE,
+    'member': RoleBit.MEMBER,
+    'evaluator': RoleBit.EVALUATOR,
+}
+
+
 class Membership(TimestampedModel):
     """Represents a user's membership in an organization with a specific role."""
 
@@ -103,7 +163,7 @@ class Membership(TimestampedModel):
         MEMBER = 'member', 'Member'
         EVALUATOR = 'evaluator', 'Evaluator'
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -119,18 +179,41 @@ class Membership(TimestampedModel):
         choices=Role.choices,
         default=Role.MEMBER,
     )
+    # Derived from role by the database, so it can never drift from it
+    role_bits = models.GeneratedField(
+        expression=models.Case(
+            *[models.When(role=role, then=models.Value(bit)) for role, bit in ROLE_BITS.items()],
+            default=models.Value(0),
+        ),
+        output_field=models.PositiveSmallIntegerField(),
+        db_persist=True,
+    )
+
+    objects = MembershipQuerySet.as_manager()
 
     class Meta:
         db_table = 'accounts_membership'
-        unique_together = ('user', 'organization')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'organization'],
+                name='uniq_membership_user_org',
+            ),
+        ]
 
     def __str__(self):
         return f'{self.user.email} - {self.organization.name} ({self.role})'
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if not adding:
+            # role_bits is computed by the database; reload it on next access
+            self.__dict__.pop('role_bits', None)
+
 
 class RegionAssignment(TimestampedModel):
     """Links a user to specific regions they can access."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     membership = models.ForeignKey(
         Membership,
         on_delete=models.CASCADE,
@@ -144,15 +227,22 @@ class RegionAssignment(TimestampedModel):
 
     class Meta:
         db_table = 'accounts_regionassignment'
-        unique_together = ('membership', 'region')
+        constraints = [
+            models.UniqueConstraint(fields=['membership', 'region'], name='uniq_regionassignment'),
+        ]
 
     def __str__(self):
+        # Local columns only, so logging or listing rows never triggers queries
+        return f'{self.membership_id} → {self.region_id}'
+
+    def display_name(self):
+        """Readable label; select_related('membership__user', 'region') first."""
         return f'{self.membership.user.email} → {self.region.name}'
 
 
 class StoreAssignment(TimestampedModel):
     """Links a user to specific stores they can access."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     membership = models.ForeignKey(
         Membership,
         on_delete=models.CASCADE,
@@ -166,38 +256,63 @@ class StoreAssignment(TimestampedModel):
 
     class Meta:
         db_table = 'accounts_storeassignment'
-        unique_together = ('membership', 'store')
+        constraints = [
+            models.UniqueConstraint(fields=['membership', 'store'], name='uniq_storeassignment'),
+        ]
 
     def __str__(self):
+        # Local columns only, so logging or listing rows never triggers queries
+        return f'{self.membership_id} → {self.store_id}'
+
+    def display_name(self):
+        """Readable label; select_related('membership__user', 'store') first."""
         return f'{self.membership.user.email} → {self.store.name}'
 
 
+# Roles an admin can grant through the member invite/update endpoints
+INVITABLE_ROLE_CHOICES = tuple(
+    (value, label) for value, label in Membership.Role.choices
+    if value not in (Membership.Role.OWNER, Membership.Role.EVALUATOR)
+)
+
+
+# Ticket choices live at module level so SupportTicket.Meta can build its
+# CHECK constraints from them; the model exposes them as SupportTicket.Status etc.
+class TicketStatus(models.TextChoices):
+    OPEN = 'open', 'Open'
+    IN_PROGRESS = 'in_progress', 'In Progress'
+    RESOLVED = 'resolved', 'Resolved'
+    CLOSED = 'closed', 'Closed'
+
+
+class TicketPriority(models.TextChoices):
+    LOW = 'low', 'Low'
+    MEDIUM = 'medium', 'Medium'
+    HIGH = 'high', 'High'
+
+
+class TicketCategory(models.TextChoices):
+    BUG = 'bug', 'Bug'
+    UI_FEEDBACK = 'ui_feedback', 'UI Feedback'
+    ENHANCEMENT = 'enhancement', 'Enhancement Request'
+    QUESTION = 'question', 'Question'
+    OTHER = 'other', 'Other'
+
+
+class TicketSource(models.TextChoices):
+    MANUAL = 'manual', 'Manual'
+    SENTRY = 'sentry', 'Sentry'
+
+
 class SupportTicket(TimestampedModel):
     """A support ticket submitted by an organization member."""
 
-    class Status(models.TextChoices):
-        OPEN = 'open', 'Open'
-        IN_PROGRESS = 'in_progress', 'In Progress'
-        RESOLVED = 'resolved', 'Resolved'
-        CLOSED = 'closed', 'Closed'
-
-    class Priority(models.TextChoices):
-        LOW = 'low', 'Low'
-        MEDIUM = 'medium', 'Medium'
-        HIGH = 'high', 'High'
-
-    class Category(models.TextChoices):
-        BUG = 'bug', 'Bug'
-        UI_FEEDBACK = 'ui_feedback', 'UI Feedback'
-        ENHANCEMENT = 'enhancement', 'Enhancement Request'
-        QUESTION = 'question', 'Question'
-        OTHER = 'other', 'Other'
-
-    class Source(models.TextChoices):
-        MANUAL = 'manual', 'Manual'
-        SENTRY = 'sentry', 'Sentry'
+    Status = TicketStatus
+    Priority = TicketPriority
+    Category = TicketCategory
+    Source = TicketSource
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     organization = models.ForeignKey(
         Organization,
         on_delete=models.CASCADE,
@@ -237,17 +352,56 @@ class SupportTicket(TimestampedModel):
     )
     resolution_notes = models.TextField(blank=True, default='')
 
+    objects = SupportTicketQuerySet.as_manager()
+
     class Meta:
         db_table = 'accounts_supportticket'
         ordering = ['-created_at']
+        indexes = [
+            GinIndex(OpClass(Upper('subject'), name='gin_trgm_ops'), name='accounts_ticket_subject_trgm'),
+            models.Index(fields=['organization', '-created_at'], name='ticket_org_created_idx'),
+            models.Index(fields=['status', '-created_at'], name='ticket_status_created_idx'),
+        ]
+        constraints = [
+            # One ticket per Sentry issue; also serves the webhook's dedup lookup
+            models.UniqueConstraint(
+                fields=['source', 'external_id'],
+                condition=models.Q(source='sentry') & ~models.Q(external_id=''),
+                name='uniq_sentry_external_id',
+            ),
+            # Let bulk .update() calls rely on the database to reject values
+            # outside the choices; adding a choice generates a migration.
+            models.CheckConstraint(
+                condition=models.Q(status__in=TicketStatus.values),
+                name='ck_supportticket_status',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(priority__in=TicketPriority.values),
+                name='ck_supportticket_priority',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(category__in=TicketCategory.values),
+                name='ck_supportticket_category',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(source__in=TicketSource.values),
+                name='ck_supportticket_source',
+            ),
+        ]
 
     def __str__(self):
         return f'[{self.status}] {self.subject}'
 
 
+# Choice values frozen once; TextChoices.choices/.values rebuild a list on every access
+TICKET_STATUS_VALUES = frozenset(SupportTicket.Status.values)
+TICKET_PRIORITY_VALUES = tuple(SupportTicket.Priority.values)
+TICKET_CATEGORY_VALUES = tuple(SupportTicket.Category.values)
+
+
 class TicketMessage(models.Model):
     """A message in a support ticket thread."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     ticket = models.ForeignKey(
         SupportTicket,
         on_delete=models.CASCADE,
@@ -266,7 +420,12 @@ class TicketMessage(models.Model):
     class Meta:
         db_table = 'accounts_ticketmessage'
         ordering = ['created_at']
+        indexes = [
+            # Returns a ticket's thread already in display order. message is
+            # not INCLUDEd: long texts would exceed the b-tree tuple size limit.
+            models.Index(fields=['ticket', 'created_at'], include=['user'], name='idx_ticketmsg_ticket_created'),
+        ]
 
     def __str__(self):
-        sender = self.user.email if self.user else 'System'
+        sender = self.user_id or 'System'
         return f'{sender}: {self.message[:50]}'
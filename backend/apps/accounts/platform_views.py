@@ -3,25 +3,116 @@ Platform admin views — accessible only to is_staff / is_superuser users.
 Provides org management across all franchises.
 """
 
-from django.contrib.auth.hashers import make_password
-from django.db import transaction
+import hashlib
+import json
+import logging
+from datetime import timedelta
 
+import stripe
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.core.files.storage import storages
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, Max, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce, TruncDate, TruncMonth
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
 from django.utils.crypto import get_random_string
-from django.utils.text import slugify
-from rest_framework import status
+from django.utils.http import quote_etag
+from rest_framework import serializers, status
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.billing.models import Subscription
+from apps.billing.views import VOLUME_COUPON_MAP
+from apps.core.pagination import StandardResultsSetPagination
 from apps.core.throttles import LeadCaptureRateThrottle
-
+from apps.core.uuid import uuid7
 from apps.stores.models import Region, Store
 from apps.stores.serializers import RegionSerializer, StoreSerializer
-from apps.walks.models import Walk
+from apps.walks.models import AIUsageLog, Department, Walk
 
+from . import store_import
+from .emails import CHAT_ANSWER_LABELS
+from .leads import Lead
 from .models import Membership, Organization, User
 from .serializers import MembershipSerializer, OrganizationSerializer, UserSerializer
+from .tasks import (
+    import_stores_csv,
+    schedule_drip_campaign,
+    send_chat_lead_notification,
+    setup_demo_for_lead,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _org_subquery(model, aggregate, default=0, **filters):
+    """
+    Correlated subquery computing ``aggregate`` over ``model`` rows for the
+    outer Organization. Unlike annotating several reverse joins at once, each
+    aggregate is evaluated on its own, so counts don't multiply across joins.
+    """
+    rows = (
+        model.objects.filter(organization=OuterRef('pk'), **filters)
+        .order_by()
+        .values('organization')
+        .annotate(value=aggregate)
+        .values('value')
+    )
+    return Coalesce(Subquery(rows), default) if default is not None else Subquery(rows)
+
+
+_OWNER_VALUES = (
+    'owner__id', 'owner__email', 'owner__first_name', 'owner__last_name',
+    'owner__full_name', 'owner__is_staff', 'owner__is_superuser',
+    'owner__date_joined', 'owner__avatar',
+)
+_datetime_field = serializers.DateTimeField()
+
+
+def _owner_from_values(row):
+    """
+    Build the ``UserSerializer`` shape for an org owner straight from a
+    ``.values()`` row, skipping model hydration and serializer field lookup.
+    """
+    avatar = row['owner__avatar']
+    return {
+        'id': str(row['owner__id']),
+        'email': row['owner__email'],
+        'first_name': row['owner__first_name'],
+        'last_name': row['owner__last_name'],
+        'full_name': row['owner__full_name'],
+        'is_staff': row['owner__is_staff'],
+        'is_superuser': row['owner__is_superuser'],
+        'date_joined': _datetime_field.to_representation(row['owner__date_joined']),
+        'avatar_url': User._meta.get_field('avatar').storage.url(avatar) if avatar else None,
+    }
+
+
+def _org_summary_dict(row, owner_data):
+    """
+    Org summary shape shared by the platform org list and create responses.
+    ``row`` holds the org columns and any annotated counts; missing counts
+    default to zero, as for a freshly created org.
+    """
+    last_walk_date = row.get('last_walk_date')
+    return {
+        'id': str(row['id']),
+        'name': row['name'],
+        'slug': row['slug'],
+        'is_active': row['is_active'],
+        'owner': owner_data,
+        'member_count': row.get('member_count', 0),
+        'store_count': row.get('store_count', 0),
+        'walk_count': row.get('walk_count', 0),
+        'completed_walk_count': row.get('completed_walk_count', 0),
+        'last_walk_date': last_walk_date.isoformat() if last_walk_date else None,
+        'created_at': row['created_at'].isoformat(),
+    }
 
 
 class PlatformOrgListView(APIView):
@@ -35,37 +126,27 @@ class PlatformOrgListView(APIView):
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def get(self, request):
-        orgs = Organization.objects.select_related('owner').order_by('-created_at')
-
-        data = []
-        for org in orgs:
-            store_ct = Store.objects.filter(organization=org).count()
-            walk_ct = Walk.objects.filter(organization=org).count()
-            completed_ct = Walk.objects.filter(
-                organization=org, status='completed'
-            ).count()
-            member_ct = Membership.objects.filter(organization=org).count()
-            last_walk = Walk.objects.filter(
-                organization=org, status='completed'
-            ).order_by('-completed_date').values_list('completed_date', flat=True).first()
-
-            data.append({
-                'id': str(org.id),
-                'name': org.name,
-                'slug': org.slug,
-                'is_active': org.is_active,
-                'owner': UserSerializer(org.owner).data,
-                'member_count': member_ct,
-                'store_count': store_ct,
-                'walk_count': walk_ct,
-                'completed_walk_count': completed_ct,
-                'last_walk_date': last_walk.isoformat() if last_walk else None,
-                'created_at': org.created_at.isoformat(),
-            })
+        completed = {'status': 'completed'}
+        rows = Organization.objects.annotate(
+            store_count=_org_subquery(Store, Count('id')),
+            walk_count=_org_subquery(Walk, Count('id')),
+            completed_walk_count=_org_subquery(Walk, Count('id'), **completed),
+            member_count=_org_subquery(Membership, Count('id')),
+            last_walk_date=_org_subquery(Walk, Max('completed_date'), default=None, **completed),
+        ).order_by('-created_at').values(
+            'id', 'name', 'slug', 'is_active', 'created_at', *_OWNER_VALUES,
+            'store_count', 'walk_count', 'completed_walk_count', 'member_count',
+            'last_walk_date',
+        )
+
+        # Plain dicts end to end: no model instances, no serializer per row
+        data = [
+            _org_summary_dict(row, _owner_from_values(row))
+            for row in rows.iterator(chunk_size=500)
+        ]
 
         return Response(data)
 
-    @transaction.atomic
     def post(self, request):
         """Create a new organization with an owner."""
         org_name = request.data.get('name', '').strip()
@@ -84,50 +165,47 @@ class PlatformOrgListView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Create or get owner user
-        user, created = User.objects.get_or_create(
-            email=owner_email,
-            defaults={
-                'first_name': owner_first or 'Admin',
-                'last_name': owner_last or '',
-                'password': make_password(get_random_string(24)),
-            },
-        )
-
-        # Create org with unique slug
-        base_slug = slugify(org_name)
-        slug = base_slug
-        counter = 1
-        while Organization.objects.filter(slug=slug).exists():
-            slug = f'{base_slug}-{counter}'
-            counter += 1
-
-        org = Organization.objects.create(
-            name=org_name,
-            slug=slug,
-            owner=user,
-        )
+        # One transaction and no nested savepoints: get_or_create would wrap
+        # its INSERT in SAVEPOINT/RELEASE round trips to recover from a
+        # duplicate, but a concurrent duplicate owner or slug can just fail
+        # the whole request instead.
+        try:
+            with transaction.atomic():
+                user = User.objects.filter(email__iexact=owner_email).first()
+                if user is None:
+                    user = User.objects.create(
+                        email=owner_email,
+                        first_name=owner_first or 'Admin',
+                        last_name=owner_last or '',
+                        password=make_password(get_random_string(24)),
+                    )
+
+                org = Organization.objects.create(
+                    name=org_name,
+                    slug=Organization.objects.unique_slug(org_name),
+                    owner=user,
+                )
 
-        # Create owner membership
-        Membership.objects.create(
-            user=user,
-            organization=org,
-            role=Membership.Role.OWNER,
-        )
+                Membership.objects.create(
+                    user=user,
+                    organization=org,
+                    role=Membership.Role.OWNER,
+                )
+        except IntegrityError:
+            return Response(
+                {'detail': 'Owner or organization was created concurrently. Please retry.'},
+                status=status.HTTP_409_CONFLICT,
+            )
 
-        return Response({
-            'id': str(org.id),
+        row = {
+            'id': org.id,
             'name': org.name,
             'slug': org.slug,
             'is_active': org.is_active,
-            'owner': UserSerializer(user).data,
+            'created_at': org.created_at,
             'member_count': 1,
-            'store_count': 0,
-            'walk_count': 0,
-            'completed_walk_count': 0,
-            'last_walk_date': None,
-            'created_at': org.created_at.isoformat(),
-        }, status=status.HTTP_201_CREATED)
+        }
+        return Response(_org_summary_dict(row, UserSerializer(user).data), status=status.HTTP_201_CREATED)
 
 
 class PlatformOrgDetailView(APIView):
@@ -136,23 +214,82 @@ class PlatformOrgDetailView(APIView):
         Get org details with stores and members.
     """
     permission_classes = [IsAuthenticated, IsAdminUser]
+    CACHE_TTL = 600
 
     def get(self, request, org_id):
+        version = self._version(org_id)
+        if version is None:
+            return Response({'detail': 'Not found.'}, status=404)
+
+        # The version changes whenever the org or one of its stores, members,
+        # regions, departments or subscription is written, added or removed.
+        # User profiles and store/department links carry no timestamp, so the
+        # version also rolls over every CACHE_TTL: the cache key and the ETag
+        # both change then, and those edits show up within CACHE_TTL even for
+        # clients revalidating with If-None-Match.
+        bucket = int(timezone.now().timestamp()) // self.CACHE_TTL
+        digest = hashlib.sha1(repr((*version, bucket)).encode()).hexdigest()
+        etag = quote_etag(digest)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            not_modified['ETag'] = etag
+            return not_modified
+
         try:
-            org = Organization.objects.select_related('owner').get(id=org_id)
+            data = cache.get_or_set(
+                f'platform_org_detail:{org_id}:{digest}',
+                lambda: self._compute_detail(org_id),
+                self.CACHE_TTL,
+            )
         except Organization.DoesNotExist:
             return Response({'detail': 'Not found.'}, status=404)
+        return Response(data, headers={'ETag': etag})
+
+    @staticmethod
+    def _version(org_id):
+        """
+        Return a tuple that changes whenever the detail payload would, in
+        one query, or None if the org doesn't exist.
+        """
+        return Organization.objects.filter(id=org_id).annotate(
+            stores_updated=_org_subquery(Store, Max('updated_at'), default=None),
+            store_count=_org_subquery(Store, Count('id')),
+            members_updated=_org_subquery(Membership, Max('updated_at'), default=None),
+            member_count=_org_subquery(Membership, Count('id')),
+            regions_updated=_org_subquery(Region, Max('updated_at'), default=None),
+            region_count=_org_subquery(Region, Count('id')),
+            departments_updated=_org_subquery(Department, Max('updated_at'), default=None),
+            subscription_updated=_org_subquery(Subscription, Max('updated_at'), default=None),
+        ).values_list(
+            'updated_at', 'stores_updated', 'store_count', 'members_updated',
+            'member_count', 'regions_updated', 'region_count', 'departments_updated',
+            'subscription_updated',
+        ).first()
 
-        stores = Store.objects.filter(organization=org).select_related('region')
-        members = Membership.objects.filter(
+    @staticmethod
+    def _compute_detail(org_id):
+        """Build the detail payload; raises Organization.DoesNotExist."""
+        org = Organization.objects.select_related('owner').only(
+            'id', 'name', 'slug', 'is_active', 'created_at', *_OWNER_VALUES,
+        ).get(id=org_id)
+
+        # Prefetch what StoreSerializer and RegionSerializer read per row
+        stores = Store.objects.filter(organization=org).select_related('region').prefetch_related('departments')
+        members = list(Membership.objects.filter(
             organization=org
-        ).select_related('user').order_by('created_at')
-        regions = Region.objects.filter(organization=org)
+        ).select_related('user').only(
+            'id', 'role', 'created_at', 'user__id', 'user__email', 'user__first_name',
+            'user__last_name', 'user__full_name', 'user__is_staff', 'user__is_superuser',
+            'user__date_joined', 'user__avatar',
+        ).order_by('created_at'))
+        member_users = UserSerializer([m.user for m in members], many=True).data
+        regions = Region.objects.filter(organization=org).select_related(
+            'parent', 'manager__user',
+        ).prefetch_related('stores', 'children__stores', 'children__manager__user')
 
         # Include subscription info if available
         subscription_data = None
         try:
-            from apps.billing.models import Subscription
             sub = Subscription.objects.select_related('plan').get(organization=org)
             subscription_data = {
                 'plan_name': sub.plan.name,
@@ -167,7 +304,7 @@ class PlatformOrgDetailView(APIView):
         except Exception:
             pass
 
-        return Response({
+        return {
             'organization': {
                 'id': str(org.id),
                 'name': org.name,
@@ -180,33 +317,32 @@ class PlatformOrgDetailView(APIView):
             'members': [
                 {
                     'id': str(m.id),
-                    'user': UserSerializer(m.user).data,
+                    'user': user,
                     'role': m.role,
                     'created_at': m.created_at.isoformat(),
                 }
-                for m in members
+                for m, user in zip(members, member_users)
             ],
             'regions': RegionSerializer(regions, many=True).data,
             'subscription': subscription_data,
-        })
+        }
 
     def patch(self, request, org_id):
         try:
-            org = Organization.objects.get(id=org_id)
+            org = Organization.objects.only('id', 'name', 'slug').get(id=org_id)
         except Organization.DoesNotExist:
             return Response({'detail': 'Not found.'}, status=404)
 
         name = request.data.get('name')
         if name:
             org.name = name.strip()
-            org.save()
+            org.save(update_fields=['name', 'updated_at'])
 
         # Handle promo discount fields
         promo_name = request.data.get('promo_discount_name')
         promo_percent = request.data.get('promo_discount_percent')
 
         if promo_name is not None or promo_percent is not None:
-            from apps.billing.models import Subscription
             try:
                 sub = Subscription.objects.get(organization=org)
                 update_fields = ['updated_at']
@@ -235,7 +371,7 @@ class PlatformOrgDetailView(APIView):
 
                 # Sync coupon to Stripe immediately if subscription is active
                 if sub.stripe_subscription_id:
-                    _apply_promo_to_stripe(sub)
+                    _apply_promo_to_stripe(sub, org_name=org.name)
 
             except Subscription.DoesNotExist:
                 pass
@@ -247,40 +383,44 @@ class PlatformOrgDetailView(APIView):
         })
 
 
-def _apply_promo_to_stripe(sub):
-    """Apply or remove promo coupon on a Stripe subscription."""
-    import logging
-    from django.conf import settings as django_settings
+# PROMO_<n> coupon ids confirmed to exist in Stripe by this process. They are
+# never deleted once created, so each id needs at most one retrieve.
+_KNOWN_PROMO_COUPONS = set()
 
-    logger = logging.getLogger(__name__)
 
-    if not django_settings.STRIPE_SECRET_KEY:
+def _apply_promo_to_stripe(sub, org_name=None):
+    """
+    Apply or remove promo coupon on a Stripe subscription. Pass ``org_name``
+    when the caller already has the organization, so a failure log line
+    doesn't lazy-load ``sub.organization``.
+    """
+    if not settings.STRIPE_SECRET_KEY:
         return
 
-    import stripe
-    stripe.api_key = django_settings.STRIPE_SECRET_KEY
+    stripe.api_key = settings.STRIPE_SECRET_KEY
 
     try:
         if sub.promo_discount_percent > 0:
             coupon_id = f'PROMO_{sub.promo_discount_percent}'
             # Create coupon if it doesn't exist
-            try:
-                stripe.Coupon.retrieve(coupon_id)
-            except stripe.error.InvalidRequestError:
-                stripe.Coupon.create(
-                    id=coupon_id,
-                    percent_off=sub.promo_discount_percent,
-                    duration='forever',
-                    name=f'Promotional Discount ({sub.promo_discount_percent}%)',
-                )
+            if coupon_id not in _KNOWN_PROMO_COUPONS:
+                try:
+                    stripe.Coupon.retrieve(coupon_id)
+                except stripe.error.InvalidRequestError:
+                    stripe.Coupon.create(
+                        id=coupon_id,
+                        percent_off=sub.promo_discount_percent,
+                        duration='forever',
+                        name=f'Promotional Discount ({sub.promo_discount_percent}%)',
+                    )
+                _KNOWN_PROMO_COUPONS.add(coupon_id)
             stripe.Subscription.modify(sub.stripe_subscription_id, coupon=coupon_id)
         else:
             # Promo removed — revert to volume discount coupon if applicable
-            from apps.billing.views import VOLUME_COUPON_MAP
             volume_coupon = VOLUME_COUPON_MAP.get(sub.discount_percent, '')
             stripe.Subscription.modify(sub.stripe_subscription_id, coupon=volume_coupon or '')
     except Exception as e:
-        logger.error(f'Failed to apply promo coupon for {sub.organization}: {e}')
+        logger.error(f'Failed to apply promo coupon for {org_name or sub.organization}: {e}')
 
 
 class PlatformOrgStoresView(APIView):
@@ -292,18 +432,14 @@ class PlatformOrgStoresView(APIView):
 
     def post(self, request, org_id):
         try:
-            org = Organization.objects.get(id=org_id)
+            org = Organization.objects.only('id').get(id=org_id)
         except Organization.DoesNotExist:
             return Response({'detail': 'Organization not found.'}, status=404)
 
-        data = request.data.copy()
-        serializer = StoreSerializer(data=data)
+        serializer = StoreSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        store = serializer.save(organization=org)
-        return Response(
-            StoreSerializer(store).data,
-            status=status.HTTP_201_CREATED,
-        )
+        serializer.save(organization=org)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
 class PlatformStatsView(APIView):
@@ -312,79 +448,118 @@ class PlatformStatsView(APIView):
         Platform-wide statistics.
     """
     permission_classes = [IsAuthenticated, IsAdminUser]
+    CACHE_KEY = 'platform_stats_v2'
+    CACHE_TTL = 60
 
     def get(self, request):
-        return Response({
-            'total_organizations': Organization.objects.count(),
-            'total_stores': Store.objects.count(),
-            'total_users': User.objects.count(),
-            'total_walks': Walk.objects.count(),
-            'total_completed_walks': Walk.objects.filter(status='completed').count(),
-        })
+        # Dashboards poll this; counts a minute stale are fine. The ETag is
+        # cached with the payload, so a matching If-None-Match is answered
+        # with a bodyless 304 without serializing anything.
+        data, etag = cache.get_or_set(self.CACHE_KEY, self._compute_stats, self.CACHE_TTL)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            not_modified['ETag'] = etag
+            return not_modified
+        return Response(data, headers={'ETag': etag})
+
+    @classmethod
+    def _compute_stats(cls):
+        """Return the stats payload and its ETag."""
+        # All five counts as scalar subqueries so the stats cost one round trip
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT
+                    (SELECT COUNT(*) FROM {Organization._meta.db_table}),
+                    (SELECT COUNT(*) FROM {Store._meta.db_table}),
+                    (SELECT COUNT(*) FROM {User._meta.db_table}),
+                    walks.total,
+                    walks.completed
+                FROM (
+                    SELECT COUNT(*) AS total,
+                           COUNT(*) FILTER (WHERE status = %s) AS completed
+                    FROM {Walk._meta.db_table}
+                ) AS walks
+                """,
+                [Walk.Status.COMPLETED],
+            )
+            orgs, stores, users, walks, completed_walks = cursor.fetchone()
+
+        data = {
+            'total_organizations': orgs,
+            'total_stores': stores,
+            'total_users': users,
+            'total_walks': walks,
+            'total_completed_walks': completed_walks,
+        }
+        digest = hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()
+        return data, quote_etag(digest)
 
 
 class PlatformEngagementView(APIView):
     """GET /api/v1/auth/platform/engagement/ — aggregated engagement stats."""
     permission_classes = [IsAuthenticated, IsAdminUser]
+    CACHE_KEY = 'platform_engagement_v1'
+    CACHE_TTL = 60 * 5
 
     def get(self, request):
-        from django.db.models import Count, Q
-        from django.utils import timezone
-        from datetime import timedelta
-
-        from apps.billing.models import Subscription
+        return Response(cache.get_or_set(self.CACHE_KEY, self._compute_engagement, self.CACHE_TTL))
 
+    @staticmethod
+    def _compute_engagement():
         now = timezone.now()
         thirty_days_ago = now - timedelta(days=30)
 
-        # Subscription status counts
-        trialing = Subscription.objects.filter(status='trialing').count()
-        active = Subscription.objects.filter(status='active').count()
-        canceled = Subscription.objects.filter(status='canceled').count()
-
-        # Conversion rate
-        total_trials = Subscription.objects.filter(trial_start__isnull=False).count()
-        converted = Subscription.objects.filter(
-            trial_start__isnull=False, status='active',
-        ).count()
-        conversion_rate = round(converted / total_trials * 100, 1) if total_trials > 0 else 0
-
-        # Engagement tiers (by completed walk count)
-        # OrgScopedModel uses related_name='%(app_label)s_%(class)ss',
-        # so Organization -> Walk is 'walks_walks'
-        orgs_with_walks = Organization.objects.annotate(
-            walk_count=Count('walks_walks', filter=Q(walks_walks__status='completed'))
+        # Subscription status counts and trial conversion in one scan
+        trial = Q(trial_start__isnull=False)
+        sub_stats = Subscription.objects.aggregate(
+            trialing=Count('id', filter=Q(status='trialing')),
+            active=Count('id', filter=Q(status='active')),
+            canceled=Count('id', filter=Q(status='canceled')),
+            total_trials=Count('id', filter=trial),
+            converted=Count('id', filter=trial & Q(status='active')),
         )
-        zero_walks = orgs_with_walks.filter(walk_count=0).count()
-        one_to_five = orgs_with_walks.filter(walk_count__gte=1, walk_count__lte=5).count()
-        five_plus = orgs_with_walks.filter(walk_count__gt=5).count()
-
-        # Average walks per org
-        total_orgs = Organization.objects.count()
-        total_completed = Walk.objects.filter(status='completed').count()
-        avg_walks = round(total_completed / total_orgs, 1) if total_orgs > 0 else 0
-
-        # Recent signups (last 30 days, grouped by day)
-        recent_orgs = Organization.objects.filter(
-            created_at__gte=thirty_days_ago,
-        ).extra(select={'day': "DATE(created_at)"}).values('day').annotate(
+        total_trials = sub_stats['total_trials']
+        conversion_rate = round(sub_stats['converted'] / total_trials * 100, 1) if total_trials > 0 else 0
+
+        # Engagement tiers (by completed walk count), org total and completed
+        # walk total, all aggregated over one per-org walk count
+        org_stats = Organization.objects.annotate(
+            walk_count=_org_subquery(Walk, Count('id'), status='completed'),
+        ).aggregate(
+            total_orgs=Count('id'),
+            total_completed=Coalesce(Sum('walk_count'), 0),
+            zero_walks=Count('id', filter=Q(walk_count=0)),
+            one_to_five=Count('id', filter=Q(walk_count__gte=1, walk_count__lte=5)),
+            five_plus=Count('id', filter=Q(walk_count__gt=5)),
+        )
+        total_orgs = org_stats['total_orgs']
+        avg_walks = round(org_stats['total_completed'] / total_orgs, 1) if total_orgs > 0 else 0
+
+        # Recent signups (last 30 days, grouped by day). Filtering on the
+        # truncated day too lets org_created_day_idx serve both clauses.
+        recent_orgs = Organization.objects.annotate(
+            day=TruncDate('created_at'),
+        ).filter(
+            day__gte=thirty_days_ago.date(),
+        ).values('day').annotate(
             count=Count('id'),
         ).order_by('day')
 
-        return Response({
+        return {
             'total_orgs': total_orgs,
-            'trialing': trialing,
-            'active': active,
-            'canceled': canceled,
+            'trialing': sub_stats['trialing'],
+            'active': sub_stats['active'],
+            'canceled': sub_stats['canceled'],
             'conversion_rate': conversion_rate,
             'avg_walks_per_org': avg_walks,
             'engagement_tiers': {
-                'zero_walks': zero_walks,
-                'one_to_five': one_to_five,
-                'five_plus': five_plus,
+                'zero_walks': org_stats['zero_walks'],
+                'one_to_five': org_stats['one_to_five'],
+                'five_plus': org_stats['five_plus'],
             },
             'recent_signups': list(recent_orgs),
-        })
+        }
 
 
 class PlatformLeadFunnelView(APIView):
@@ -392,36 +567,32 @@ class PlatformLeadFunnelView(APIView):
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def get(self, request):
-        from django.db.models import Count
-
-        from .leads import Lead
-
-        # Lead counts by source
-        by_source = list(
-            Lead.objects.values('source').annotate(count=Count('id')).order_by('-count')
+        # Per-source totals and conversions in one scan; the by-source counts
+        # and the overall total are derived from it
+        source_rows = list(
+            Lead.objects.values('source').annotate(
+                total=Count('id'),
+                converted=Count('id', filter=Q(status='converted')),
+            ).order_by('-total')
         )
+        by_source = [{'source': row['source'], 'count': row['total']} for row in source_rows]
+        conversion_by_source = [
+            {
+                'source': row['source'],
+                'total': row['total'],
+                'converted': row['converted'],
+                'rate': round(row['converted'] / row['total'] * 100, 1) if row['total'] > 0 else 0,
+            }
+            for row in source_rows
+        ]
 
         # Lead counts by status
         by_status = list(
             Lead.objects.values('status').annotate(count=Count('id')).order_by('-count')
         )
 
-        # Conversion by source
-        conversion_by_source = []
-        sources = Lead.objects.values_list('source', flat=True).distinct()
-        for src in sources:
-            total = Lead.objects.filter(source=src).count()
-            converted = Lead.objects.filter(source=src, status='converted').count()
-            rate = round(converted / total * 100, 1) if total > 0 else 0
-            conversion_by_source.append({
-                'source': src,
-                'total': total,
-                'converted': converted,
-                'rate': rate,
-            })
-
         return Response({
-            'total_leads': Lead.objects.count(),
+            'total_leads': sum(row['total'] for row in source_rows),
             'by_source': by_source,
             'by_status': by_status,
             'conversion_by_source': conversion_by_source,
@@ -433,11 +604,6 @@ class PlatformOrgActivationView(APIView):
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def post(self, request, org_id):
-        try:
-            org = Organization.objects.get(id=org_id)
-        except Organization.DoesNotExist:
-            return Response({'detail': 'Not found.'}, status=404)
-
         action = request.data.get('action')
         if action not in ('activate', 'deactivate'):
             return Response(
@@ -445,81 +611,74 @@ class PlatformOrgActivationView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        org.is_active = (action == 'activate')
-        org.save(update_fields=['is_active'])
-        return Response({'id': str(org.id), 'is_active': org.is_active})
+        # Single UPDATE; the row itself is never needed. update() skips
+        # auto_now, so updated_at is set explicitly.
+        is_active = (action == 'activate')
+        updated = Organization.objects.filter(id=org_id).update(
+            is_active=is_active,
+            updated_at=timezone.now(),
+        )
+        if not updated:
+            return Response({'detail': 'Not found.'}, status=404)
+        return Response({'id': str(org_id), 'is_active': is_active})
 
 
 class PlatformOrgStoreImportView(APIView):
-    """POST /api/v1/auth/platform/orgs/:id/stores/import/ — bulk import stores from CSV."""
+    """
+    POST /api/v1/auth/platform/orgs/:id/stores/import/ — bulk import stores from CSV.
+
+    Uploads up to ASYNC_THRESHOLD bytes are imported inline and answered with
+    ``{'created', 'errors'}``. Larger uploads are stored and imported by a
+    Celery task; the response is 202 with a ``job_id`` to poll.
+    """
     permission_classes = [IsAuthenticated, IsAdminUser]
     parser_classes = [MultiPartParser, FormParser]
+    ASYNC_THRESHOLD = 1024 * 1024  # ~10k rows
 
     def post(self, request, org_id):
-        import csv
-        import io
-
-        try:
-            org = Organization.objects.get(id=org_id)
-        except Organization.DoesNotExist:
+        if not Organization.objects.filter(id=org_id).exists():
             return Response({'detail': 'Organization not found.'}, status=404)
 
         csv_file = request.FILES.get('file')
         if not csv_file:
             return Response({'detail': 'No CSV file provided.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        import json
         mapping_raw = request.data.get('column_mapping', '{}')
         try:
             mapping = json.loads(mapping_raw) if isinstance(mapping_raw, str) else mapping_raw
         except json.JSONDecodeError:
             return Response({'detail': 'Invalid column_mapping JSON.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        content = csv_file.read().decode('utf-8-sig')
-        reader = csv.reader(io.StringIO(content))
-        rows = list(reader)
-
-        if len(rows) < 2:
-            return Response({'detail': 'CSV must have header + data rows.'}, status=status.HTTP_400_BAD_REQUEST)
-
-        # Build region lookup
-        region_map = {}
-        for r in Region.objects.filter(organization=org):
-            region_map[r.name.lower()] = r
-
-        created = 0
-        errors = []
-        for row_idx, row in enumerate(rows[1:], start=2):
-            try:
-                name = row[mapping.get('name', 0)].strip()
-                store_number = row[mapping.get('store_number', 1)].strip() if len(row) > mapping.get('store_number', 1) else ''
-                address = row[mapping.get('address', 2)].strip() if len(row) > mapping.get('address', 2) else ''
-                city = row[mapping.get('city', 3)].strip() if len(row) > mapping.get('city', 3) else ''
-                state_val = row[mapping.get('state', 4)].strip() if len(row) > mapping.get('state', 4) else ''
-                zip_code = row[mapping.get('zip_code', 5)].strip() if len(row) > mapping.get('zip_code', 5) else ''
-                region_name = row[mapping.get('region', 6)].strip() if len(row) > mapping.get('region', 6) else ''
-
-                if not name:
-                    errors.append(f'Row {row_idx}: Missing store name.')
-                    continue
+        try:
+            columns = store_import.resolve_columns(mapping)
+            if csv_file.size <= self.ASYNC_THRESHOLD:
+                result = store_import.import_stores(org_id, csv_file.file, columns)
+                return Response(result, status=status.HTTP_201_CREATED)
+        except store_import.StoreImportError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        job_id = str(uuid7())
+        # Customer data: keep it out of the public media storage
+        path = storages['private'].save(f'imports/{org_id}/{job_id}.csv', csv_file)
+        cache.set(
+            store_import.job_cache_key(job_id),
+            {'status': 'pending', 'org_id': str(org_id)},
+            store_import.JOB_TTL,
+        )
+        import_stores_csv.delay(str(org_id), path, columns, job_id)
+        return Response({'job_id': job_id, 'status': 'pending'}, status=status.HTTP_202_ACCEPTED)
 
-                region = region_map.get(region_name.lower()) if region_name else None
 
-                Store.objects.create(
-                    organization=org,
-                    name=name,
-                    store_number=store_number,
-                    address=address,
-                    city=city,
-                    state=state_val,
-                    zip_code=zip_code,
-                    region=region,
-                )
-                created += 1
-            except (IndexError, ValueError) as e:
-                errors.append(f'Row {row_idx}: {e}')
+class PlatformOrgStoreImportStatusView(APIView):
+    """GET /api/v1/auth/platform/orgs/:id/stores/import/:job_id/ — poll a background import."""
+    permission_classes = [IsAuthenticated, IsAdminUser]
 
-        return Response({'created': created, 'errors': errors[:20]}, status=status.HTTP_201_CREATED)
+    def get(self, request, org_id, job_id):
+        job = cache.get(store_import.job_cache_key(job_id))
+        # Jobs are only visible through the org they were started for
+        if job is None or job.pop('org_id', None) != str(org_id):
+            return Response({'detail': 'Not found.'}, status=404)
+        return Response(job)
 
 
 class LeadListView(APIView):
@@ -537,30 +696,40 @@ class LeadListView(APIView):
         return []
 
     def get(self, request):
-        from .leads import Lead
-        leads = Lead.objects.all().order_by('-created_at')
-        data = []
-        for lead in leads:
-            data.append({
-                'id': str(lead.id),
-                'email': lead.email,
-                'first_name': lead.first_name,
-                'last_name': lead.last_name,
-                'company_name': lead.company_name,
-                'phone': lead.phone,
-                'store_count': lead.store_count,
-                'message': lead.message,
-                'status': lead.status,
-                'source': lead.source,
-                'demo_org': str(lead.demo_org_id) if lead.demo_org_id else None,
-                'demo_expires_at': lead.demo_expires_at.isoformat() if lead.demo_expires_at else None,
-                'created_at': lead.created_at.isoformat(),
-            })
-        return Response(data)
+        leads = Lead.objects.only(
+            'id', 'email', 'first_name', 'last_name', 'company_name', 'phone', 'store_count',
+            'message', 'status', 'source', 'demo_org', 'demo_expires_at', 'created_at',
+        ).order_by('-created_at')
 
-    def post(self, request):
-        from .leads import Lead
+        # Paginate when the client asks for a page; the full list stays the
+        # default so existing callers keep receiving a bare array
+        if 'page' in request.query_params:
+            paginator = StandardResultsSetPagination()
+            page = paginator.paginate_queryset(leads, request, view=self)
+            return paginator.get_paginated_response([self._lead_row(lead) for lead in page])
 
+        # Stream rows in chunks rather than caching every Lead on the queryset
+        return Response([self._lead_row(lead) for lead in leads.iterator(chunk_size=500)])
+
+    @staticmethod
+    def _lead_row(lead):
+        return {
+            'id': str(lead.id),
+            'email': lead.email,
+            'first_name': lead.first_name,
+            'last_name': lead.last_name,
+            'company_name': lead.company_name,
+            'phone': lead.phone,
+            'store_count': lead.store_count,
+            'message': lead.message,
+            'status': lead.status,
+            'source': lead.source,
+            'demo_org': str(lead.demo_org_id) if lead.demo_org_id else None,
+            'demo_expires_at': lead.demo_expires_at.isoformat() if lead.demo_expires_at else None,
+            'created_at': lead.created_at.isoformat(),
+        }
+
+    def post(self, request):
         email = request.data.get('email', '').strip().lower()
         first_name = request.data.get('first_name', '').strip()
         last_name = request.data.get('last_name', '').strip()
@@ -583,7 +752,6 @@ class LeadListView(APIView):
         )
 
         # Trigger async demo setup + drip campaign
-        from .tasks import schedule_drip_campaign, setup_demo_for_lead
         setup_demo_for_lead.delay(str(lead.id))
         schedule_drip_campaign.delay(str(lead.id))
 
@@ -598,9 +766,12 @@ class LeadDetailView(APIView):
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def get(self, request, lead_id):
-        from .leads import Lead
         try:
-            lead = Lead.objects.select_related('demo_org').get(id=lead_id)
+            lead = Lead.objects.select_related('demo_org').only(
+                'id', 'email', 'first_name', 'last_name', 'company_name', 'phone',
+                'store_count', 'message', 'status', 'source', 'demo_expires_at',
+                'created_at', 'demo_org__id', 'demo_org__name',
+            ).get(id=lead_id)
         except Lead.DoesNotExist:
             return Response({'detail': 'Not found.'}, status=404)
 
@@ -624,7 +795,6 @@ class LeadDetailView(APIView):
         })
 
     def patch(self, request, lead_id):
-        from .leads import Lead
         try:
             lead = Lead.objects.get(id=lead_id)
         except Lead.DoesNotExist:
@@ -633,7 +803,7 @@ class LeadDetailView(APIView):
         new_status = request.data.get('status')
         if new_status:
             lead.status = new_status
-            lead.save(update_fields=['status'])
+            lead.save(update_fields=['status', 'updated_at'])
 
         return Response({'id': str(lead.id), 'status': lead.status})
 
@@ -644,13 +814,6 @@ class ChatLeadView(APIView):
     throttle_classes = [LeadCaptureRateThrottle]
 
     def post(self, request):
-        import json
-        import logging
-
-        logger = logging.getLogger(__name__)
-
-        from .leads import Lead
-
         name = request.data.get('name', '').strip()
         email = request.data.get('email', '').strip().lower()
         phone = request.data.get('phone', '').strip()
@@ -669,18 +832,10 @@ class ChatLeadView(APIView):
         last_name = name_parts[1] if len(name_parts) > 1 else ''
 
         # Build a summary message from the chat answers
-        summary_parts = []
-        answer_labels = {
-            'greeting': 'Intent',
-            'role': 'Role',
-            'store-count': 'Store count',
-            'current-process': 'Current process',
-            'pain-point': 'Pain point',
-            'question-topic': 'Question topic',
-        }
-        for key, label in answer_labels.items():
-            if key in answers:
-                summary_parts.append(f'{label}: {answers[key]}')
+        summary_parts = [
+            f'{label}: {answers[key]}'
+            for key, label in CHAT_ANSWER_LABELS.items() if key in answers
+        ]
         if page:
             summary_parts.append(f'Page: {page}')
 
@@ -690,13 +845,13 @@ class ChatLeadView(APIView):
         existing = Lead.objects.filter(email=email).first()
         if existing:
             # Update the existing lead with new chat context
-            existing.message = (existing.message + '\n\n--- Chat Widget ---\n' + message).strip()
+            existing.message = ''.join([existing.message, '\n\n--- Chat Widget ---\n', message]).strip()
             if phone and not existing.phone:
                 existing.phone = phone
-            existing.save(update_fields=['message', 'phone'])
+            existing.save(update_fields=['message', 'phone', 'updated_at'])
 
             # Still send notification email
-            self._send_notification(existing, answers, page)
+            send_chat_lead_notification.delay(str(existing.id), answers, page)
 
             return Response({
                 'id': str(existing.id),
@@ -713,86 +868,16 @@ class ChatLeadView(APIView):
         )
 
         # Schedule drip campaign
-        from .tasks import schedule_drip_campaign
         schedule_drip_campaign.delay(str(lead.id))
 
         # Send notification email
-        self._send_notification(lead, answers, page)
+        send_chat_lead_notification.delay(str(lead.id), answers, page)
 
         return Response({
             'id': str(lead.id),
             'message': 'Thanks! Someone will reach out shortly.',
         }, status=status.HTTP_201_CREATED)
 
-    @staticmethod
-    def _send_notification(lead, answers, page):
-        """Send an email notification to the site owner about the new chat lead."""
-        import logging
-
-        import resend
-        from django.conf import settings
-
-        logger = logging.getLogger(__name__)
-
-        if not settings.RESEND_API_KEY:
-            logger.warning('RESEND_API_KEY not configured, skipping chat lead notification')
-            return
-
-        resend.api_key = settings.RESEND_API_KEY
-
-        answer_labels = {
-            'greeting': 'Intent',
-            'role': 'Role',
-            'store-count': 'Store count',
-            'current-process': 'Current process',
-            'pain-point': 'Pain point',
-            'question-topic': 'Question topic',
-        }
-
-        answers_html = ''
-        for key, label in answer_labels.items():
-            if key in answers:
-                answers_html += f'<tr><td style="padding:4px 12px 4px 0;font-size:13px;color:#6b7280;font-weight:600;">{label}</td><td style="padding:4px 0;font-size:13px;color:#111827;">{answers[key]}</td></tr>'
-
-        html = f'''<!DOCTYPE html>
-<html>
-<head><meta charset="utf-8"></head>
-<body style="margin:0;padding:0;background-color:#f3f4f6;font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,sans-serif;">
-<div style="max-width:640px;margin:0 auto;padding:24px;">
-    <div style="background-color:#D40029;border-radius:12px 12px 0 0;padding:24px;text-align:center;">
-        <h1 style="color:white;margin:0;font-size:18px;font-weight:700;">New Chat Lead</h1>
-        <p style="color:rgba(255,255,255,0.85);margin:6px 0 0;font-size:13px;">Someone wants to talk via the chat widget</p>
-    </div>
-    <div style="background-color:white;padding:24px;">
-        <div style="background:#f9fafb;border:1px solid #e5e7eb;border-radius:8px;padding:16px;margin:0 0 16px;">
-            <p style="margin:0 0 4px;font-size:14px;color:#111827;"><strong>Name:</strong> {lead.first_name} {lead.last_name}</p>
-            <p style="margin:0 0 4px;font-size:14px;color:#111827;"><strong>Email:</strong> {lead.email}</p>
-            <p style="margin:0 0 4px;font-size:14px;color:#111827;"><strong>Phone:</strong> {lead.phone or '(not provided)'}</p>
-            <p style="margin:0;font-size:14px;color:#111827;"><strong>Page:</strong> {page or '(unknown)'}</p>
-        </div>
-        {f'<table style="width:100%;border-collapse:collapse;margin:0 0 16px;">{answers_html}</table>' if answers_html else ''}
-        <p style="margin:0;font-size:12px;color:#9ca3af;">Source: Chat widget &middot; Lead ID: {lead.id}</p>
-    </div>
-    <div style="padding:16px;text-align:center;background-color:white;border-top:1px solid #e5e7eb;border-radius:0 0 12px 12px;">
-        <p style="margin:0;font-size:11px;color:#9ca3af;">StoreScore — Store Quality Management</p>
-    </div>
-</div>
-</body>
-</html>'''
-
-        try:
-            # Send to the site owner
-            owner_email = getattr(settings, 'LEAD_NOTIFICATION_EMAIL', '') or settings.DEFAULT_FROM_EMAIL
-            resend.Emails.send({
-                'from': settings.DEFAULT_FROM_EMAIL,
-                'to': [owner_email],
-                'subject': f'Chat Lead: {lead.first_name} {lead.last_name} ({lead.email})',
-                'html': html,
-            })
-            logger.info(f'Chat lead notification sent for {lead.email}')
-        except Exception as e:
-            logger.error(f'Failed to send chat lead notification for {lead.email}: {e}')
-
 
 class EmailCaptureView(APIView):
     """POST /api/v1/auth/email-capture/ — lightweight lead capture (email + optional name)."""
@@ -800,8 +885,6 @@ class EmailCaptureView(APIView):
     throttle_classes = [LeadCaptureRateThrottle]
 
     def post(self, request):
-        from .leads import Lead
-
         email = request.data.get('email', '').strip().lower()
         if not email:
             return Response(
@@ -812,11 +895,11 @@ class EmailCaptureView(APIView):
         first_name = request.data.get('first_name', '').strip() or email.split('@')[0]
         source = request.data.get('source', 'homepage')
 
-        # Check if lead already exists with this email
-        existing = Lead.objects.filter(email=email).first()
-        if existing:
+        # Check if lead already exists with this email; only the id is needed
+        existing_id = Lead.objects.filter(email=email).values_list('id', flat=True).first()
+        if existing_id:
             return Response({
-                'id': str(existing.id),
+                'id': str(existing_id),
                 'message': 'Thanks! We\'ll be in touch.',
                 'existing': True,
             }, status=status.HTTP_200_OK)
@@ -830,7 +913,6 @@ class EmailCaptureView(APIView):
         )
 
         # Schedule drip campaign (no full demo setup for email-only captures)
-        from .tasks import schedule_drip_campaign
         schedule_drip_campaign.delay(str(lead.id))
 
         return Response({
@@ -844,11 +926,6 @@ class PlatformAICostView(APIView):
     permission_classes = [IsAuthenticated, IsAdminUser]
 
     def get(self, request):
-        from django.db.models import Count, Sum
-        from django.db.models.functions import TruncMonth
-
-        from apps.walks.models import AIUsageLog
-
         qs = AIUsageLog.objects.all()
 
         # Totals
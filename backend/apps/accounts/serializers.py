@@ -1,12 +1,22 @@
 from django.contrib.auth import authenticate
 from django.contrib.auth.hashers import make_password
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.utils.crypto import get_random_string
-from django.utils.text import slugify
 from rest_framework import serializers
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from .models import Membership, Organization, RegionAssignment, StoreAssignment, SupportTicket, TicketMessage, User
+from .models import (
+    INVITABLE_ROLE_CHOICES,
+    TICKET_CATEGORY_VALUES,
+    TICKET_PRIORITY_VALUES,
+    Membership,
+    Organization,
+    RegionAssignment,
+    StoreAssignment,
+    SupportTicket,
+    TicketMessage,
+    User,
+)
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -34,7 +44,7 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
 
     def validate_email(self, value):
         value = value.lower()
-        if User.objects.filter(email=value).exclude(id=self.instance.id).exists():
+        if User.objects.filter(email__iexact=value).exclude(id=self.instance.id).exists():
             raise serializers.ValidationError('A user with this email already exists.')
         return value
 
@@ -71,7 +81,7 @@ class AdminUserUpdateSerializer(serializers.ModelSerializer):
 
     def validate_email(self, value):
         value = value.lower()
-        if User.objects.filter(email=value).exclude(id=self.instance.id).exists():
+        if User.objects.filter(email__iexact=value).exclude(id=self.instance.id).exists():
             raise serializers.ValidationError('A user with this email already exists.')
         return value
 
@@ -90,9 +100,14 @@ class OrganizationSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'slug', 'owner', 'is_active', 'created_at', 'updated_at']
 
 
+class OrganizationSummarySerializer(OrganizationSerializer):
+    """Organization details with the owner as an id, for lists nesting many orgs."""
+    owner = serializers.PrimaryKeyRelatedField(read_only=True)
+
+
 class MembershipSerializer(serializers.ModelSerializer):
     """Serializer for membership details."""
-    organization = OrganizationSerializer(read_only=True)
+    organization = OrganizationSummarySerializer(read_only=True)
 
     class Meta:
         model = Membership
@@ -100,6 +115,19 @@ class MembershipSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+def _token_pair(user):
+    """
+    Issue a refresh token for ``user`` and encode it and its access token
+    once each. Tokens are deliberately not cached across requests: every
+    login must get its own refresh token so rotation and blacklisting work.
+    """
+    refresh = RefreshToken.for_user(user)
+    return {
+        'access': str(refresh.access_token),
+        'refresh': str(refresh),
+    }
+
+
 class RegisterSerializer(serializers.Serializer):
     """Serializer for user registration. Creates User + Organization + Membership."""
     email = serializers.EmailField()
@@ -109,9 +137,10 @@ class RegisterSerializer(serializers.Serializer):
     org_name = serializers.CharField(max_length=255)
 
     def validate_email(self, value):
-        if User.objects.filter(email=value).exists():
+        value = value.lower()
+        if User.objects.filter(email__iexact=value).exists():
             raise serializers.ValidationError('A user with this email already exists.')
-        return value.lower()
+        return value
 
     @transaction.atomic
     def create(self, validated_data):
@@ -125,19 +154,16 @@ class RegisterSerializer(serializers.Serializer):
             last_name=validated_data['last_name'],
         )
 
-        # Create organization with unique slug
-        base_slug = slugify(org_name)
-        slug = base_slug
-        counter = 1
-        while Organization.objects.filter(slug=slug).exists():
-            slug = f'{base_slug}-{counter}'
-            counter += 1
-
-        organization = Organization.objects.create(
-            name=org_name,
-            slug=slug,
-            owner=user,
-        )
+        # Create organization with unique slug. A concurrent signup can take
+        # the same slug between the lookup and the INSERT; retry once with a
+        # random suffix rather than failing the registration.
+        slug = Organization.objects.unique_slug(org_name)
+        try:
+            with transaction.atomic():
+                organization = Organization.objects.create(name=org_name, slug=slug, owner=user)
+        except IntegrityError:
+            suffix = get_random_string(6, allowed_chars='abcdefghijklmnopqrstuvwxyz0123456789')
+            organization = Organization.objects.create(name=org_name, slug=f'{slug}-{suffix}', owner=user)
 
         # Create owner membership
         Membership.objects.create(
@@ -146,18 +172,19 @@ class RegisterSerializer(serializers.Serializer):
             role=Membership.Role.OWNER,
         )
 
+        # Kept for to_representation, which would otherwise re-query it
+        self._organization = organization
         return user
 
     def to_representation(self, user):
-        refresh = RefreshToken.for_user(user)
-        membership = user.memberships.select_related('organization').first()
+        organization = getattr(self, '_organization', None)
+        if organization is None:
+            membership = user.memberships.select_related('organization').first()
+            organization = membership.organization if membership else None
         return {
             'user': UserSerializer(user).data,
-            'organization': OrganizationSerializer(membership.organization).data if membership else None,
-            'tokens': {
-                'access': str(refresh.access_token),
-                'refresh': str(refresh),
-            },
+            'organization': OrganizationSerializer(organization).data if organization else None,
+            'tokens': _token_pair(user),
         }
 
 
@@ -189,15 +216,11 @@ class LoginSerializer(serializers.Serializer):
         return validated_data['user']
 
     def to_representation(self, user):
-        refresh = RefreshToken.for_user(user)
-        memberships = user.memberships.select_related('organization').all()
+        memberships = user.memberships.select_related('organization')
         return {
             'user': UserSerializer(user).data,
             'memberships': MembershipSerializer(memberships, many=True).data,
-            'tokens': {
-                'access': str(refresh.access_token),
-                'refresh': str(refresh),
-            },
+            'tokens': _token_pair(user),
         }
 
 
@@ -212,11 +235,19 @@ class OrgMemberSerializer(serializers.ModelSerializer):
         fields = ['id', 'user', 'role', 'assigned_regions', 'assigned_stores', 'created_at']
         read_only_fields = fields
 
+    # Built from the prefetch cache (see managers.assignment_prefetches);
+    # .values() here would bypass it and query once per member.
     def get_assigned_regions(self, obj):
-        return list(obj.region_assignments.values('id', 'region__id', 'region__name'))
+        return [
+            {'id': a.id, 'region__id': a.region.id, 'region__name': a.region.name}
+            for a in obj.region_assignments.all()
+        ]
 
     def get_assigned_stores(self, obj):
-        return list(obj.store_assignments.values('id', 'store__id', 'store__name'))
+        return [
+            {'id': a.id, 'store__id': a.store.id, 'store__name': a.store.name}
+            for a in obj.store_assignments.all()
+        ]
 
 
 class InviteMemberSerializer(serializers.Serializer):
@@ -224,16 +255,7 @@ class InviteMemberSerializer(serializers.Serializer):
     email = serializers.EmailField()
     first_name = serializers.CharField(max_length=150)
     last_name = serializers.CharField(max_length=150)
-    role = serializers.ChoiceField(
-        choices=[
-            ('admin', 'Admin'),
-            ('regional_manager', 'Regional Manager'),
-            ('store_manager', 'Store Manager'),
-            ('manager', 'Manager'),
-            ('finance', 'Finance'),
-            ('member', 'Member'),
-        ],
-    )
+    role = serializers.ChoiceField(choices=INVITABLE_ROLE_CHOICES)
     region_ids = serializers.ListField(
         child=serializers.UUIDField(),
         required=False,
@@ -253,12 +275,7 @@ class InviteMemberSerializer(serializers.Serializer):
         email = attrs['email']
 
         # Check if user is already a member of this org
-        existing_membership = Membership.objects.filter(
-            user__email=email,
-            organization=org,
-        ).first()
-
-        if existing_membership:
+        if Membership.objects.filter(user__email__iexact=email, organization=org).exists():
             raise serializers.ValidationError(
                 {'email': 'This user is already a member of this organization.'}
             )
@@ -277,8 +294,9 @@ class InviteMemberSerializer(serializers.Serializer):
 
         # Get or create user
         user, created = User.objects.get_or_create(
-            email=email,
+            email__iexact=email,
             defaults={
+                'email': email,
                 'first_name': first_name,
                 'last_name': last_name,
                 'password': make_password(get_random_string(24)),
@@ -292,35 +310,25 @@ class InviteMemberSerializer(serializers.Serializer):
             role=role,
         )
 
-        # Create region assignments
-        for region_id in region_ids:
-            RegionAssignment.objects.create(
-                membership=membership,
-                region_id=region_id,
-            )
+        # One INSERT per relation; duplicate ids collapse to one assignment
+        if region_ids:
+            RegionAssignment.objects.bulk_create([
+                RegionAssignment(membership=membership, region_id=region_id)
+                for region_id in dict.fromkeys(region_ids)
+            ], batch_size=500)
 
-        # Create store assignments
-        for store_id in store_ids:
-            StoreAssignment.objects.create(
-                membership=membership,
-                store_id=store_id,
-            )
+        if store_ids:
+            StoreAssignment.objects.bulk_create([
+                StoreAssignment(membership=membership, store_id=store_id)
+                for store_id in dict.fromkeys(store_ids)
+            ], batch_size=500)
 
         return membership
 
 
 class UpdateMemberRoleSerializer(serializers.Serializer):
     """Serializer for updating a member's role and assignments."""
-    role = serializers.ChoiceField(
-        choices=[
-            ('admin', 'Admin'),
-            ('regional_manager', 'Regional Manager'),
-            ('store_manager', 'Store Manager'),
-            ('manager', 'Manager'),
-            ('finance', 'Finance'),
-            ('member', 'Member'),
-        ],
-    )
+    role = serializers.ChoiceField(choices=INVITABLE_ROLE_CHOICES)
     region_ids = serializers.ListField(
         child=serializers.UUIDField(),
         required=False,
@@ -363,11 +371,11 @@ class SupportTicketCreateSerializer(serializers.Serializer):
     subject = serializers.CharField(max_length=255)
     description = serializers.CharField()
     priority = serializers.ChoiceField(
-        choices=['low', 'medium', 'high'],
+        choices=TICKET_PRIORITY_VALUES,
         default='medium',
     )
     category = serializers.ChoiceField(
-        choices=['bug', 'ui_feedback', 'enhancement', 'question', 'other'],
+        choices=TICKET_CATEGORY_VALUES,
         default='other',
         required=False,
     )
@@ -0,0 +1,116 @@
+"""
+CSV store import for the platform admin, shared by the inline request path
+and the Celery task used for large uploads.
+"""
+
+import csv
+import io
+
+from django.db import transaction
+
+BATCH_SIZE = 1000
+JOB_TTL = 60 * 60 * 24  # Keep background job results pollable for a day
+
+# Store field -> default CSV column, overridable via column_mapping
+COLUMN_DEFAULTS = (
+    ('name', 0), ('store_number', 1), ('address', 2), ('city', 3),
+    ('state', 4), ('zip_code', 5), ('region', 6),
+)
+
+
+class StoreImportError(ValueError):
+    """The upload as a whole can't be imported (as opposed to a bad row)."""
+
+
+def resolve_columns(mapping):
+    """
+    Resolve a column_mapping dict to the list of column indexes in
+    COLUMN_DEFAULTS order, so rows can be read by plain indexing.
+    """
+    try:
+        columns = [int(mapping.get(field, default)) for field, default in COLUMN_DEFAULTS]
+    except (AttributeError, TypeError, ValueError):
+        columns = None
+    if columns is None or min(columns) < 0:
+        raise StoreImportError('column_mapping values must be column numbers.')
+    return columns
+
+
+def import_stores(org_id, binary_file, columns):
+    """
+    Create stores for ``org_id`` from a CSV file opened in binary mode.
+    Rows are parsed lazily and written with bulk_create every BATCH_SIZE
+    stores, all in one transaction. Returns ``{'created', 'errors'}`` with
+    at most 20 row errors.
+    """
+    from apps.stores.models import Region, Store
+
+    name_col, number_col, address_col, city_col, state_col, zip_col, region_col = columns
+    width = max(columns) + 1
+
+    reader = csv.reader(io.TextIOWrapper(binary_file, encoding='utf-8-sig', newline=''))
+    if next(reader, None) is None:
+        raise StoreImportError('CSV must have header + data rows.')
+
+    # Build region lookup (lowercased name -> id); stores only need the FK
+    region_map = {
+        name.lower(): region_id
+        for name, region_id in Region.objects.filter(organization_id=org_id).values_list('name', 'id')
+    }
+
+    created = 0
+    seen_rows = False
+    stores = []
+    errors = []
+    with transaction.atomic():
+        for row_idx, row in enumerate(reader, start=2):
+            seen_rows = True
+            # Pad short rows once so every mapped column can be read directly
+            if len(row) < width:
+                row += [''] * (width - len(row))
+            try:
+                name = row[name_col].strip()
+                store_number = row[number_col].strip()
+                address = row[address_col].strip()
+                city = row[city_col].strip()
+                state_val = row[state_col].strip()
+                zip_code = row[zip_col].strip()
+                region_name = row[region_col].strip()
+
+                if not name:
+                    errors.append(f'Row {row_idx}: Missing store name.')
+                    continue
+
+                region_id = region_map.get(region_name.lower()) if region_name else None
+
+                stores.append(Store(
+                    organization_id=org_id,
+                    name=name,
+                    store_number=store_number,
+                    address=address,
+                    city=city,
+                    state=state_val,
+                    zip_code=zip_code,
+                    region_id=region_id,
+                ))
+            except (IndexError, ValueError) as e:
+                errors.append(f'Row {row_idx}: {e}')
+                continue
+
+            # Flush as we go so at most one batch of stores is held in memory
+            if len(stores) >= BATCH_SIZE:
+                Store.objects.bulk_create(stores, batch_size=BATCH_SIZE)
+                created += len(stores)
+                stores.clear()
+
+        if not seen_rows:
+            raise StoreImportError('CSV must have header + data rows.')
+
+        Store.objects.bulk_create(stores, batch_size=BATCH_SIZE)
+        created += len(stores)
+
+    return {'created': created, 'errors': errors[:20]}
+
+
+def job_cache_key(job_id):
+    return f'store_import:{job_id}'
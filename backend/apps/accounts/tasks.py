@@ -23,7 +23,6 @@ def setup_demo_for_lead(self, lead_id: str):
     """
     from django.contrib.auth.hashers import make_password
     from django.utils.crypto import get_random_string
-    from django.utils.text import slugify
 
     from .leads import Lead
     from .models import Membership, Organization, User
@@ -37,8 +36,9 @@ def setup_demo_for_lead(self, lead_id: str):
     # Create or get user
     temp_password = get_random_string(12)
     user, created = User.objects.get_or_create(
-        email=lead.email,
+        email__iexact=lead.email,
         defaults={
+            'email': lead.email,
             'first_name': lead.first_name,
             'last_name': lead.last_name,
             'password': make_password(temp_password),
@@ -53,16 +53,9 @@ def setup_demo_for_lead(self, lead_id: str):
     # Create demo org
     company = lead.company_name or f'{lead.first_name} {lead.last_name}'
     org_name = f'{company} Demo'
-    base_slug = slugify(org_name)
-    slug = base_slug
-    counter = 1
-    while Organization.objects.filter(slug=slug).exists():
-        slug = f'{base_slug}-{counter}'
-        counter += 1
-
     org = Organization.objects.create(
         name=org_name,
-        slug=slug,
+        slug=Organization.objects.unique_slug(org_name),
         owner=user,
     )
 
@@ -142,7 +135,7 @@ def setup_demo_for_lead(self, lead_id: str):
     lead.demo_org = org
     lead.demo_expires_at = timezone.now() + timedelta(days=14)
     lead.status = 'demo_active'
-    lead.save(update_fields=['demo_org', 'demo_expires_at', 'status'])
+    lead.save(update_fields=['demo_org', 'demo_expires_at', 'status', 'updated_at'])
 
     # Send welcome email
     _send_demo_welcome_email(lead, user, temp_password, org)
@@ -251,11 +244,11 @@ def cleanup_expired_demos(self):
         org = lead.demo_org
         if org and org.is_active:
             org.is_active = False
-            org.save(update_fields=['is_active'])
+            org.save(update_fields=['is_active', 'updated_at'])
             deactivated += 1
 
         lead.status = 'closed'
-        lead.save(update_fields=['status'])
+        lead.save(update_fields=['status', 'updated_at'])
 
     logger.info(f'Demo cleanup: deactivated {deactivated} expired demo orgs')
 
@@ -305,6 +298,92 @@ def schedule_drip_campaign(self, lead_id: str):
     logger.info(f'Scheduled {created_count} drip emails for lead {lead_id}')
 
 
+def _retry_backoff(task):
+    """Exponential backoff for task retries: default_retry_delay, then 2x, 4x..."""
+    return task.default_retry_delay * 2 ** task.request.retries
+
+
+@shared_task(bind=True, max_retries=2, default_retry_delay=30)
+def send_invitation_email_task(self, user_id: str, organization_id: str, role: str):
+    """Send a team invitation email outside the request/response cycle."""
+    from .emails import send_invitation_email
+    from .models import Organization, User
+
+    try:
+        user = User.objects.get(id=user_id)
+        organization = Organization.objects.get(id=organization_id)
+    except (User.DoesNotExist, Organization.DoesNotExist):
+        logger.error(f'Invitation email skipped: user {user_id} or org {organization_id} not found')
+        return
+
+    try:
+        send_invitation_email(user, organization, role)
+    except Exception as e:
+        logger.warning(f'Invitation email to user {user_id} failed, retrying: {e}')
+        raise self.retry(exc=e, countdown=_retry_backoff(self))
+
+
+@shared_task(bind=True, max_retries=2, default_retry_delay=30)
+def send_password_reset_email_task(self, user_id: str, admin_initiated: bool = False):
+    """Send a password reset email outside the request/response cycle."""
+    from .emails import send_password_reset_email
+    from .models import User
+
+    try:
+        user = User.objects.get(id=user_id, is_active=True)
+    except User.DoesNotExist:
+        logger.error(f'Password reset email skipped: user {user_id} not found')
+        return
+
+    try:
+        send_password_reset_email(user, admin_initiated=admin_initiated)
+    except Exception as e:
+        logger.warning(f'Password reset email to user {user_id} failed, retrying: {e}')
+        raise self.retry(exc=e, countdown=_retry_backoff(self))
+
+
+@shared_task(bind=True, max_retries=0)
+def import_stores_csv(self, org_id: str, path: str, columns: list, job_id: str):
+    """Import a large platform store CSV saved to private storage, recording the outcome for polling."""
+    from django.core.cache import cache
+    from django.core.files.storage import storages
+
+    from .store_import import JOB_TTL, StoreImportError, import_stores, job_cache_key
+
+    try:
+        with storages['private'].open(path, 'rb') as f:
+            result = {'status': 'done', **import_stores(org_id, f, columns)}
+    except StoreImportError as e:
+        result = {'status': 'failed', 'detail': str(e)}
+    except Exception as e:
+        logger.error(f'Store import {job_id} for org {org_id} failed: {e}')
+        result = {'status': 'failed', 'detail': 'Import failed.'}
+    finally:
+        storages['private'].delete(path)
+
+    cache.set(job_cache_key(job_id), {**result, 'org_id': org_id}, JOB_TTL)
+    logger.info(f'Store import {job_id} for org {org_id}: {result["status"]}')
+
+
+@shared_task(bind=True, max_retries=2, default_retry_delay=30)
+def send_chat_lead_notification(self, lead_id: str, answers: dict, page: str = ''):
+    """Notify the site owner about a chat widget lead outside the request/response cycle."""
+    from .emails import send_chat_lead_email
+    from .leads import Lead
+
+    try:
+        lead = Lead.objects.get(id=lead_id)
+    except Lead.DoesNotExist:
+        logger.error(f'Chat lead notification skipped: lead {lead_id} not found')
+        return
+
+    try:
+        send_chat_lead_email(lead, answers, page)
+    except Exception as e:
+        logger.warning(f'Chat lead notification for lead {lead_id} failed, retrying: {e}')
+        raise self.retry(exc=e, countdown=_retry_backoff(self))
+
+
 @shared_task(bind=True, max_retries=2, default_retry_delay=30)
 def send_ticket_notification(self, ticket_id: str):
     """Send email notification to platform admins when a new ticket is created."""
@@ -380,9 +459,11 @@ def check_trial_engagement(self):
     Daily task: check engagement milestones for trialing orgs
     and schedule conditional drip emails for missing actions.
     """
+    from django.core.cache import cache
+
     from apps.billing.models import Subscription
     from apps.stores.models import Store
-    from .emails import send_engagement_drip_email
+    from .emails import _engagement_drip_cache_key, send_engagement_drip_email
     from .models import Membership
 
     now = timezone.now()
@@ -392,7 +473,9 @@ def check_trial_engagement(self):
         trial_end__gt=now,
     ).select_related('organization', 'organization__owner')
 
-    sent_count = 0
+    # Pick the step (if any) each org is due for, then check the
+    # "already sent today" keys in a single cache round trip.
+    pending = []
     for sub in trialing_subs:
         org = sub.organization
         owner = org.owner
@@ -409,34 +492,31 @@ def check_trial_engagement(self):
 
         # Day 2: "Add your first store" if no stores
         if days_since_start >= 2 and not has_stores:
-            if send_engagement_drip_email(owner, org, 'add_store', {
+            pending.append((owner, org, 'add_store', {
                 'first_name': owner.first_name,
                 'org_name': org.name,
-            }):
-                sent_count += 1
+            }))
 
         # Day 5: "Invite your team" if solo
         elif days_since_start >= 5 and not has_team:
-            if send_engagement_drip_email(owner, org, 'invite_team', {
+            pending.append((owner, org, 'invite_team', {
                 'first_name': owner.first_name,
                 'org_name': org.name,
-            }):
-                sent_count += 1
+            }))
 
         # Day 8: "Complete your first walk" if 0 walks
         elif days_since_start >= 8 and not has_walks:
-            if send_engagement_drip_email(owner, org, 'first_walk', {
+            pending.append((owner, org, 'first_walk', {
                 'first_name': owner.first_name,
                 'org_name': org.name,
-            }):
-                sent_count += 1
+            }))
 
         # Day 11: "3 days left" with personalized stats
         elif days_since_start >= 11:
             store_count = Store.objects.filter(organization=org).count()
             member_count = Membership.objects.filter(organization=org).count()
             walk_count = Walk.objects.filter(organization=org, status='completed').count()
-            if send_engagement_drip_email(owner, org, 'trial_recap', {
+            pending.append((owner, org, 'trial_recap', {
                 'first_name': owner.first_name,
                 'org_name': org.name,
                 'store_count': store_count,
@@ -444,8 +524,18 @@ def check_trial_engagement(self):
                 'walk_count': walk_count,
                 'has_ai_summary': has_ai_summary,
                 'days_left': max(0, (sub.trial_end - now).days),
-            }):
-                sent_count += 1
+            }))
+
+    already_sent = cache.get_many([
+        _engagement_drip_cache_key(org.id, step) for _, org, step, _ in pending
+    ])
+
+    sent_count = 0
+    for owner, org, step, context in pending:
+        if _engagement_drip_cache_key(org.id, step) in already_sent:
+            continue
+        if send_engagement_drip_email(owner, org, step, context, check_cache=False):
+            sent_count += 1
 
     if sent_count:
         logger.info(f'Engagement drip: sent {sent_count} emails')
@@ -457,7 +547,7 @@ def process_drip_emails(self):
     Periodic task: find all due drip emails and send them.
     Run hourly via Celery Beat.
     """
-    from .emails import send_drip_email
+    from .emails import send_drip_emails_bulk
     from .leads import DripEmail
 
     now = timezone.now()
@@ -466,19 +556,14 @@ def process_drip_emails(self):
         .filter(sent_at__isnull=True, scheduled_at__lte=now, lead__unsubscribed=False)
         .exclude(lead__status='closed')
         .select_related('lead')
+        .only('id', 'step', 'lead__id', 'lead__first_name', 'lead__email')
         .order_by('scheduled_at')[:50]  # batch limit
     )
 
-    sent = 0
-    for drip in due_emails:
-        success = send_drip_email(drip)
-        if success:
-            drip.sent_at = now
-            drip.save(update_fields=['sent_at'])
-            sent += 1
-
+    sent = send_drip_emails_bulk(due_emails)
     if sent:
-        logger.info(f'Drip campaign: sent {sent} emails')
+        DripEmail.objects.filter(id__in=[drip.id for drip in sent]).update(sent_at=now)
+        logger.info(f'Drip campaign: sent {len(sent)} emails')
 
 
 @shared_task(bind=True)
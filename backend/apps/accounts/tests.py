@@ -0,0 +1,77 @@
+import uuid
+from unittest import mock
+
+from django.test import SimpleTestCase
+from resend.exceptions import ApplicationError, ValidationError
+
+from . import emails
+from .leads import Lead
+from .models import Organization, User
+from .tasks import (
+    send_chat_lead_notification,
+    send_invitation_email_task,
+    send_password_reset_email_task,
+)
+
+
+def _server_error():
+    return ApplicationError(code=500, error_type='application_error', message='Internal server error')
+
+
+def _validation_error():
+    return ValidationError(code=422, error_type='validation_error', message='Invalid `to` field')
+
+
+@mock.patch.object(emails, '_configure_resend', return_value=True)
+class EmailTaskRetryTests(SimpleTestCase):
+    """Email tasks retry transient Resend failures."""
+
+    def setUp(self):
+        self.user = User(id=uuid.uuid4(), email='member@example.com', first_name='Sam', last_name='Lee')
+        self.org = Organization(id=uuid.uuid4(), name='Acme Hardware', slug='acme-hardware')
+        patcher = mock.patch.object(User, 'objects')
+        patcher.start().get.return_value = self.user
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(Organization, 'objects')
+        patcher.start().get.return_value = self.org
+        self.addCleanup(patcher.stop)
+
+    def test_invitation_retries_on_5xx(self, _configure):
+        with mock.patch.object(emails.resend.Emails, 'send', side_effect=_server_error()) as send:
+            result = send_invitation_email_task.apply(args=[str(self.user.id), str(self.org.id), 'member'])
+
+        # First attempt plus max_retries, then the 5xx is surfaced as the failure
+        self.assertEqual(send.call_count, send_invitation_email_task.max_retries + 1)
+        self.assertTrue(result.failed())
+        self.assertIsInstance(result.result, ApplicationError)
+
+    def test_invitation_succeeds_after_transient_5xx(self, _configure):
+        with mock.patch.object(emails.resend.Emails, 'send', side_effect=[_server_error(), {'id': 'x'}]) as send:
+            result = send_invitation_email_task.apply(args=[str(self.user.id), str(self.org.id), 'member'])
+
+        self.assertEqual(send.call_count, 2)
+        self.assertTrue(result.successful())
+
+    def test_invitation_does_not_retry_on_4xx(self, _configure):
+        with mock.patch.object(emails.resend.Emails, 'send', side_effect=_validation_error()) as send:
+            result = send_invitation_email_task.apply(args=[str(self.user.id), str(self.org.id), 'member'])
+
+        self.assertEqual(send.call_count, 1)
+        self.assertTrue(result.successful())
+
+    def test_password_reset_retries_on_5xx(self, _configure):
+        with mock.patch.object(emails.resend.Emails, 'send', side_effect=_server_error()) as send:
+            result = send_password_reset_email_task.apply(args=[str(self.user.id)])
+
+        self.assertEqual(send.call_count, send_password_reset_email_task.max_retries + 1)
+        self.assertTrue(result.failed())
+
+    def test_chat_lead_retries_on_5xx(self, _configure):
+        lead = Lead(id=uuid.uuid4(), email='lead@example.com', first_name='Pat')
+        with mock.patch.object(Lead, 'objects') as objects, \
+                mock.patch.object(emails.resend.Emails, 'send', side_effect=_server_error()) as send:
+            objects.get.return_value = lead
+            result = send_chat_lead_notification.apply(args=[str(lead.id), {'role': 'Owner'}])
+
+        self.assertEqual(send.call_count, send_chat_lead_notification.max_retries + 1)
+        self.assertTrue(result.failed())
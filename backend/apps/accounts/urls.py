@@ -11,6 +11,7 @@ from .platform_views import (
     PlatformOrgActivationView,
     PlatformOrgDetailView,
     PlatformOrgListView,
+    PlatformOrgStoreImportStatusView,
     PlatformOrgStoreImportView,
     PlatformOrgStoresView,
     PlatformStatsView,
@@ -68,6 +69,7 @@ urlpatterns = [
     path('platform/orgs/<uuid:org_id>/stores/', PlatformOrgStoresView.as_view(), name='platform-org-stores'),
     path('platform/orgs/<uuid:org_id>/activation/', PlatformOrgActivationView.as_view(), name='platform-org-activation'),
     path('platform/orgs/<uuid:org_id>/stores/import/', PlatformOrgStoreImportView.as_view(), name='platform-org-store-import'),
+    path('platform/orgs/<uuid:org_id>/stores/import/<uuid:job_id>/', PlatformOrgStoreImportStatusView.as_view(), name='platform-org-store-import-status'),
     # Leads
     path('leads/', LeadListView.as_view(), name='lead-list'),
     path('leads/<uuid:lead_id>/', LeadDetailView.as_view(), name='lead-detail'),
@@ -13,10 +13,20 @@ from apps.core.storage import process_uploaded_image
 from apps.core.throttles import LoginRateThrottle, PasswordResetRateThrottle, SignupRateThrottle
 
 from django.db import transaction
-from django.utils.text import slugify
-
-from .emails import send_invitation_email, send_password_reset_email
-from .models import Membership, Organization, RegionAssignment, StoreAssignment, SupportTicket, TicketMessage, User
+from django.db.models import prefetch_related_objects
+
+from .managers import assignment_prefetches
+from .models import (
+    TICKET_CATEGORY_VALUES,
+    TICKET_STATUS_VALUES,
+    Membership,
+    Organization,
+    RegionAssignment,
+    StoreAssignment,
+    SupportTicket,
+    TicketMessage,
+    User,
+)
 from .serializers import (
     AdminUserUpdateSerializer,
     ChangePasswordSerializer,
@@ -109,10 +119,7 @@ class MemberListView(APIView):
     def get(self, request):
         memberships = Membership.objects.filter(
             organization=request.org,
-        ).select_related('user').prefetch_related(
-            'region_assignments__region',
-            'store_assignments__store',
-        ).order_by('created_at')
+        ).with_related().order_by('created_at')
         serializer = OrgMemberSerializer(memberships, many=True)
         return Response(serializer.data)
 
@@ -128,11 +135,13 @@ class InviteMemberView(APIView):
         )
         serializer.is_valid(raise_exception=True)
         membership = serializer.save()
+        prefetch_related_objects([membership], *assignment_prefetches())
 
         # Send welcome/invitation email
-        send_invitation_email(
-            membership.user,
-            request.org,
+        from .tasks import send_invitation_email_task
+        send_invitation_email_task.delay(
+            str(membership.user_id),
+            str(request.org.id),
             serializer.validated_data['role'],
         )
 
@@ -187,21 +196,20 @@ class MemberDetailView(APIView):
         # Update region assignments if provided
         if 'region_ids' in serializer.validated_data:
             membership.region_assignments.all().delete()
-            for region_id in serializer.validated_data['region_ids']:
-                RegionAssignment.objects.create(
-                    membership=membership,
-                    region_id=region_id,
-                )
+            RegionAssignment.objects.bulk_create([
+                RegionAssignment(membership=membership, region_id=region_id)
+                for region_id in dict.fromkeys(serializer.validated_data['region_ids'])
+            ], batch_size=500)
 
         # Update store assignments if provided
         if 'store_ids' in serializer.validated_data:
             membership.store_assignments.all().delete()
-            for store_id in serializer.validated_data['store_ids']:
-                StoreAssignment.objects.create(
-                    membership=membership,
-                    store_id=store_id,
-                )
+            StoreAssignment.objects.bulk_create([
+                StoreAssignment(membership=membership, store_id=store_id)
+                for store_id in dict.fromkeys(serializer.validated_data['store_ids'])
+            ], batch_size=500)
 
+        prefetch_related_objects([membership], *assignment_prefetches())
         return Response(OrgMemberSerializer(membership).data)
 
     def delete(self, request, member_id):
@@ -238,7 +246,8 @@ class ProfileView(APIView):
         # Handle avatar upload separately
         if 'avatar' in request.FILES:
             processed = process_uploaded_image(request.FILES['avatar'])
-            user.avatar.save(processed.name, processed, save=True)
+            user.avatar.save(processed.name, processed, save=False)
+            user.save(update_fields=['avatar'])
 
         # Handle profile field updates
         data = {}
@@ -258,7 +267,8 @@ class ProfileView(APIView):
         """Remove avatar."""
         user = request.user
         if user.avatar:
-            user.avatar.delete(save=True)
+            user.avatar.delete(save=False)
+            user.save(update_fields=['avatar'])
         return Response(UserSerializer(user).data)
 
 
@@ -289,12 +299,13 @@ class PasswordResetRequestView(APIView):
         email = serializer.validated_data['email'].lower()
 
         try:
-            user = User.objects.get(email=email, is_active=True)
+            user = User.objects.get(email__iexact=email, is_active=True)
         except User.DoesNotExist:
             # Don't reveal whether the email exists
             return Response({'detail': 'If an account with that email exists, a reset link has been sent.'})
 
-        send_password_reset_email(user)
+        from .tasks import send_password_reset_email_task
+        send_password_reset_email_task.delay(str(user.id))
 
         return Response({'detail': 'If an account with that email exists, a reset link has been sent.'})
 
@@ -349,6 +360,7 @@ class AdminUserEditView(APIView):
         )
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        prefetch_related_objects([membership], *assignment_prefetches())
         return Response(OrgMemberSerializer(membership).data)
 
     def post(self, request, member_id):
@@ -362,7 +374,8 @@ class AdminUserEditView(APIView):
             return Response({'detail': 'Member not found.'}, status=status.HTTP_404_NOT_FOUND)
 
         user = membership.user
-        send_password_reset_email(user, admin_initiated=True)
+        from .tasks import send_password_reset_email_task
+        send_password_reset_email_task.delay(str(user.id), admin_initiated=True)
 
         return Response({'detail': f'Password reset email sent to {user.email}.'})
 
@@ -373,7 +386,7 @@ class ResendInviteView(APIView):
 
     def post(self, request, member_id):
         try:
-            membership = Membership.objects.select_related('user', 'organization').get(
+            membership = Membership.objects.select_related('user').get(
                 id=member_id,
                 organization=request.org,
             )
@@ -383,18 +396,14 @@ class ResendInviteView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        sent = send_invitation_email(
-            membership.user,
-            membership.organization,
+        from .tasks import send_invitation_email_task
+        send_invitation_email_task.delay(
+            str(membership.user_id),
+            str(membership.organization_id),
             membership.role,
         )
 
-        if sent:
-            return Response({'detail': f'Invitation email resent to {membership.user.email}.'})
-        return Response(
-            {'detail': 'Failed to send invitation email. Please try again later.'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
+        return Response({'detail': f'Invitation email resent to {membership.user.email}.'})
 
 
 class SelfServeSignupView(APIView):
@@ -434,7 +443,7 @@ class SelfServeSignupView(APIView):
         if not company_name:
             errors['company_name'] = 'Company name is required.'
 
-        if email and User.objects.filter(email=email).exists():
+        if email and User.objects.filter(email__iexact=email).exists():
             errors['email'] = 'A user with this email already exists.'
 
         if errors:
@@ -449,14 +458,7 @@ class SelfServeSignupView(APIView):
         )
 
         # Create organization with unique slug
-        base_slug = slugify(company_name)
-        slug = base_slug or 'org'
-        counter = 1
-        while Organization.objects.filter(slug=slug).exists():
-            slug = f'{base_slug}-{counter}'
-            counter += 1
-
-        org = Organization(name=company_name, slug=slug, owner=user)
+        org = Organization(name=company_name, slug=Organization.objects.unique_slug(company_name), owner=user)
         # Pass trial_source to the signal via a transient attribute
         org._trial_source = trial_source
         org.save()
@@ -482,7 +484,9 @@ class SelfServeSignupView(APIView):
             status='converted',
             demo_org=org,
         )
-        schedule_drip_campaign.delay(str(lead.id))
+        # Enqueue only once the lead row is committed so the worker can see it
+        lead_id = str(lead.id)
+        transaction.on_commit(lambda: schedule_drip_campaign.delay(lead_id))
 
         # Return JWT tokens for auto-login
         refresh = RefreshToken.for_user(user)
@@ -512,8 +516,7 @@ class SupportTicketListView(APIView):
         else:
             tickets = SupportTicket.objects.none()
 
-        tickets = tickets.select_related('user', 'organization').prefetch_related('messages__user')
-        return Response(SupportTicketSerializer(tickets, many=True).data)
+        return Response(SupportTicketSerializer(tickets.with_related(), many=True).data)
 
     def post(self, request):
         from apps.core.permissions import get_org_from_request
@@ -544,7 +547,7 @@ class SupportTicketListView(APIView):
         from .tasks import send_ticket_notification
         send_ticket_notification.delay(str(ticket.id))
 
-        ticket.refresh_from_db()
+        ticket = SupportTicket.objects.with_related().get(id=ticket.id)
         return Response(
             SupportTicketSerializer(ticket).data,
             status=status.HTTP_201_CREATED,
@@ -558,9 +561,7 @@ class SupportTicketDetailView(APIView):
     def _get_ticket(self, request, ticket_id):
         from apps.core.permissions import get_org_from_request
         try:
-            ticket = SupportTicket.objects.select_related(
-                'user', 'organization'
-            ).prefetch_related('messages__user').get(id=ticket_id)
+            ticket = SupportTicket.objects.with_related().get(id=ticket_id)
         except SupportTicket.DoesNotExist:
             return None
 
@@ -613,12 +614,12 @@ class SupportTicketDetailView(APIView):
         update_fields = ['updated_at']
 
         new_status = request.data.get('status')
-        if new_status and new_status in dict(SupportTicket.Status.choices):
+        if new_status and new_status in TICKET_STATUS_VALUES:
             ticket.status = new_status
             update_fields.append('status')
 
         new_category = request.data.get('category')
-        if new_category and new_category in dict(SupportTicket.Category.choices):
+        if new_category and new_category in TICKET_CATEGORY_VALUES:
             ticket.category = new_category
             update_fields.append('category')
 
@@ -4,6 +4,7 @@ import json
 import logging
 
 from django.conf import settings
+from django.db import IntegrityError, transaction
 from django.http import HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
@@ -59,7 +60,7 @@ def _handle_issue_created(payload):
         return
 
     # Deduplicate
-    if SupportTicket.objects.filter(external_id=external_id).exists():
+    if SupportTicket.objects.filter(source='sentry', external_id=external_id).exists():
         logger.info(f'Sentry issue {external_id} already exists, skipping')
         return
 
@@ -101,14 +102,20 @@ def _handle_issue_created(payload):
     else:
         priority = 'low'
 
-    SupportTicket.objects.create(
-        source='sentry',
-        organization=None,
-        user=None,
-        subject=title,
-        description=description,
-        external_id=external_id,
-        category='bug',
-        priority=priority,
-    )
+    try:
+        with transaction.atomic():
+            SupportTicket.objects.create(
+                source='sentry',
+                organization=None,
+                user=None,
+                subject=title,
+                description=description,
+                external_id=external_id,
+                category='bug',
+                priority=priority,
+            )
+    except IntegrityError:
+        # A concurrent delivery of the same issue won the race
+        logger.info(f'Sentry issue {external_id} already exists, skipping')
+        return
     logger.info(f'Created ticket from Sentry issue {external_id}: {title}')
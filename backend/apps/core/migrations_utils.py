@@ -0,0 +1,31 @@
+"""
+Helpers for RunPython data migrations.
+"""
+
+
+def chunked_bulk_update(qs, mutate, fields, batch=1000, read_fields=()):
+    """
+    Apply ``mutate(obj)`` to every row in ``qs`` and write ``fields`` back in
+    batches. Rows are streamed with a server-side cursor and only the
+    primary key, ``fields`` and any ``read_fields`` the mutation needs are
+    loaded, so memory stays O(batch) and the write count is N / batch. Pass
+    historical models (``apps.get_model``).
+
+    ``mutate`` may return False to skip writing a row. Returns the number of
+    rows written.
+    """
+    model = qs.model
+    buf = []
+    written = 0
+    for obj in qs.only(model._meta.pk.attname, *fields, *read_fields).iterator(chunk_size=batch):
+        if mutate(obj) is False:
+            continue
+        buf.append(obj)
+        if len(buf) >= batch:
+            model._base_manager.bulk_update(buf, fields=fields, batch_size=batch)
+            written += len(buf)
+            buf.clear()
+    if buf:
+        model._base_manager.bulk_update(buf, fields=fields, batch_size=batch)
+        written += len(buf)
+    return written
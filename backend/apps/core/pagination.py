@@ -1,3 +1,6 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 from rest_framework.pagination import PageNumberPagination
 
 
@@ -5,3 +8,36 @@ class StandardResultsSetPagination(PageNumberPagination):
     page_size = 25
     page_size_query_param = 'page_size'
     max_page_size = 100
+
+
+class FasterAdminPaginator(Paginator):
+    """
+    Admin paginator that uses the PostgreSQL planner's row estimate for
+    unfiltered changelists instead of a full COUNT(*).
+
+    Falls back to an exact count when filters/search are applied or when
+    the table is small enough that the estimate isn't worth trusting.
+    """
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if getattr(queryset, 'query', None) is None or queryset.query.where:
+            return super().count
+
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return super().count
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+
+        estimate = row[0] if row else 0
+        if estimate < self.exact_count_threshold:
+            return super().count
+        return estimate
@@ -1,6 +1,6 @@
 from rest_framework.permissions import BasePermission
 
-from apps.accounts.models import Membership, Organization
+from apps.accounts.models import Membership, Organization, RoleBit
 
 # Role hierarchy levels for comparison
 ROLE_HIERARCHY = {
@@ -14,6 +14,13 @@ ROLE_HIERARCHY = {
     'evaluator': 1,
 }
 
+# Role groups as bit masks over Membership.role_bits
+ADMIN_ROLE_BITS = RoleBit.OWNER | RoleBit.ADMIN
+MANAGER_ROLE_BITS = (
+    ADMIN_ROLE_BITS | RoleBit.REGIONAL_MANAGER | RoleBit.STORE_MANAGER | RoleBit.MANAGER
+)
+ALL_STORES_ROLE_BITS = ADMIN_ROLE_BITS | RoleBit.MANAGER | RoleBit.FINANCE
+
 
 def _is_platform_admin(request):
     """Check if the request is from a staff/superuser (platform admin)."""
@@ -93,12 +100,12 @@ def get_accessible_store_ids(request_or_membership):
     if membership is None:
         return set()
 
-    role = membership.role
-
     # These roles see everything in the org
-    if role in ('owner', 'admin', 'manager', 'finance'):
+    if membership.role_bits & ALL_STORES_ROLE_BITS:
         return None  # None means "all stores"
 
+    role = membership.role
+
     # Regional managers see stores in their assigned regions + child regions
     if role == 'regional_manager':
         from apps.stores.models import Region, Store
@@ -175,7 +182,7 @@ class IsOrgAdmin(BasePermission):
         if membership is None:
             return False
 
-        return membership.role in ('owner', 'admin')
+        return bool(membership.role_bits & ADMIN_ROLE_BITS)
 
 
 class IsOrgManagerOrAbove(BasePermission):
@@ -197,9 +204,7 @@ class IsOrgManagerOrAbove(BasePermission):
         if membership is None:
             return False
 
-        return membership.role in (
-            'owner', 'admin', 'regional_manager', 'store_manager', 'manager',
-        )
+        return bool(membership.role_bits & MANAGER_ROLE_BITS)
 
 
 class IsWalkEvaluatorOrAdmin(BasePermission):
@@ -219,7 +224,7 @@ class IsWalkEvaluatorOrAdmin(BasePermission):
             return True
         # Org owners and admins can edit any walk
         membership = getattr(request, 'membership', None)
-        if membership and membership.role in ('owner', 'admin'):
+        if membership and membership.role_bits & ADMIN_ROLE_BITS:
             return True
         # Otherwise, only the evaluator who conducted the walk
         walk = obj
@@ -45,6 +45,16 @@ def org_file_path(instance, filename):
     return f'{org_slug}/_org/{unique}_{filename}'
 
 
+def org_logo_path(instance, filename):
+    """Upload path for an organization's logo.
+    Use on a field of the Organization model itself.
+    Result: {org_slug}/_org/{uuid}_{filename}
+    """
+    org_slug = _safe_slug(instance.slug)
+    unique = uuid.uuid4().hex[:8]
+    return f'{org_slug}/_org/{unique}_{filename}'
+
+
 def store_photo_path(instance, filename):
     """Upload path for general store photos.
     Use on a model with a `store` FK (store must have an `organization`).
@@ -0,0 +1,21 @@
+"""
+Time-ordered UUIDs for primary keys.
+"""
+
+import os
+import time
+import uuid
+
+
+def uuid7():
+    """
+    Return a UUIDv7: 48-bit Unix millisecond timestamp, version/variant bits,
+    then random bits. Successive values sort roughly by creation time, so new
+    rows land at the right edge of the primary key B-tree instead of on a
+    random leaf page.
+    """
+    value = int.from_bytes(os.urandom(10), 'big')  # 80 random bits
+    value &= ~(0xF << 76) & ~(0x3 << 62)  # Clear version and variant bits
+    value |= (0x7 << 76) | (0x2 << 62)  # Version 7, RFC 4122 variant
+    value |= (time.time_ns() // 1_000_000) << 80
+    return uuid.UUID(int=value)
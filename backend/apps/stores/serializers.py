@@ -95,7 +95,8 @@ class StoreSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'qr_verification_token', 'created_at', 'updated_at']
 
     def get_department_names(self, obj):
-        return list(obj.departments.values_list('name', flat=True))
+        # all() so a prefetch_related('departments') is reused
+        return [department.name for department in obj.departments.all()]
 
     def validate_region(self, value):
         """Ensure the region belongs to the same organization."""
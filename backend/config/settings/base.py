@@ -286,6 +286,17 @@ if DO_SPACES_ACCESS_KEY:
         'staticfiles': {
             'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
         },
+        # Uploads handed to background jobs (store CSV imports). Private ACL
+        # and signed URLs, never served through the public CDN domain.
+        'private': {
+            'BACKEND': 'storages.backends.s3boto3.S3Boto3Storage',
+            'OPTIONS': {
+                'default_acl': 'private',
+                'querystring_auth': True,
+                'custom_domain': None,
+                'location': f'{DO_SPACES_LOCATION}/_private',
+            },
+        },
     }
 
     AWS_ACCESS_KEY_ID = DO_SPACES_ACCESS_KEY
@@ -312,3 +323,17 @@ else:
     # Fallback to local file storage for development
     MEDIA_URL = '/media/'
     MEDIA_ROOT = BASE_DIR / 'media'
+
+    STORAGES = {
+        'default': {
+            'BACKEND': 'django.core.files.storage.FileSystemStorage',
+        },
+        'staticfiles': {
+            'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+        },
+        # Kept outside MEDIA_ROOT so it is never served
+        'private': {
+            'BACKEND': 'django.core.files.storage.FileSystemStorage',
+            'OPTIONS': {'location': BASE_DIR / 'private'},
+        },
+    }
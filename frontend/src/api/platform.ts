@@ -133,6 +133,18 @@ export interface StoreImportResult {
   errors: string[];
 }
 
+// Poll a background store import every 2s for up to 10 minutes
+const STORE_IMPORT_POLL_MS = 2000;
+const STORE_IMPORT_MAX_POLLS = 300;
+
+interface StoreImportJob {
+  job_id: string;
+  status: 'pending' | 'done' | 'failed';
+  created?: number;
+  errors?: string[];
+  detail?: string;
+}
+
 export async function importPlatformOrgStores(
   orgId: string,
   file: File,
@@ -143,12 +155,32 @@ export async function importPlatformOrgStores(
   if (columnMapping) {
     formData.append('column_mapping', JSON.stringify(columnMapping));
   }
-  const response = await api.post<StoreImportResult>(
+  const response = await api.post<StoreImportResult | StoreImportJob>(
     `/auth/platform/orgs/${orgId}/stores/import/`,
     formData,
     { headers: { 'Content-Type': 'multipart/form-data' } }
   );
-  return response.data;
+  if (response.status !== 202) {
+    return response.data as StoreImportResult;
+  }
+
+  // Large uploads are imported in the background; poll until the job finishes
+  const { job_id } = response.data as StoreImportJob;
+  for (let attempt = 0; attempt < STORE_IMPORT_MAX_POLLS; attempt++) {
+    await new Promise((r) => setTimeout(r, STORE_IMPORT_POLL_MS));
+    const { data } = await api.get<StoreImportJob>(
+      `/auth/platform/orgs/${orgId}/stores/import/${job_id}/`
+    );
+    if (data.status === 'done') {
+      return { created: data.created ?? 0, errors: data.errors ?? [] };
+    }
+    if (data.status === 'failed') {
+      throw new Error(data.detail || 'Store import failed.');
+    }
+  }
+  throw new Error(
+    'The store import is still running after 10 minutes. Refresh the organization later to see the imported stores.'
+  );
 }
 
 export interface EngagementStats {
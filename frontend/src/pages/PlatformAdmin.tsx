@@ -223,8 +223,12 @@ function OrgDetailPanel({ orgId, initialActive, onClose, onMasquerade, onOrgUpda
         setDetail(d);
         onOrgUpdated();
       }
-    } catch {
-      setImportResult({ created: 0, errors: ['Upload failed. Please check the file format.'] });
+    } catch (err: unknown) {
+      // Background import failures and the poll timeout carry their own message
+      const message = err instanceof Error && !('isAxiosError' in err)
+        ? err.message
+        : 'Upload failed. Please check the file format.';
+      setImportResult({ created: 0, errors: [message] });
     } finally {
       setImporting(false);
     }